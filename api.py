@@ -3,26 +3,43 @@ REST API for MineSentry
 Built with FastAPI for high performance
 """
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict
 from datetime import datetime
 from uuid import UUID
 from contextlib import asynccontextmanager
+import logging
+import logging.handlers
+import os
+import queue
 import uvicorn
+from celery import Celery
 
 from models import MiningPoolReport, EvidenceType, ReportStatus
 from database import Database
 from validation import ReportValidator
 from reward_system import RewardCalculator, RewardPayment
-from bitcoin_rpc import BitcoinRPC
+from bitcoin_rpc import BitcoinRPC, AsyncBitcoinRPC
 from integration_bridge import MineSentryIntegration, get_integration
 
 
+logger = logging.getLogger('minesentry.api')
+
+
+# Precomputed valid enum values: O(1) membership test instead of
+# exception-driven Enum() construction on every request
+_EVIDENCE_VALUES = frozenset(e.value for e in EvidenceType)
+_STATUS_VALUES = frozenset(s.value for s in ReportStatus)
+
+
 # Pydantic models for API requests/responses
 class ReportCreateRequest(BaseModel):
     """Request model for creating a new report"""
+    model_config = {"extra": "forbid", "frozen": True, "str_strip_whitespace": True}
+
     reporter_address: str = Field(..., description="Bitcoin address for rewards")
     pool_address: str = Field(..., description="Suspected mining pool address")
     pool_name: Optional[str] = Field(None, description="Optional pool identifier")
@@ -36,11 +53,9 @@ class ReportCreateRequest(BaseModel):
     @classmethod
     def validate_evidence_type(cls, v):
         if isinstance(v, str):
-            try:
-                EvidenceType(v.lower())
-            except ValueError:
-                raise ValueError(f"Invalid evidence type. Must be one of: {[e.value for e in EvidenceType]}")
-            return v.lower()
+            v = v.lower()
+            if v not in _EVIDENCE_VALUES:
+                raise ValueError(f"Invalid evidence type. Must be one of: {sorted(_EVIDENCE_VALUES)}")
         return v
 
 
@@ -62,11 +77,13 @@ class ReportResponse(BaseModel):
     verified_by: Optional[str]
     verified_at: Optional[str]
     
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ReportUpdateRequest(BaseModel):
     """Request model for updating report status"""
+    model_config = {"extra": "forbid", "frozen": True, "str_strip_whitespace": True}
+
     status: str = Field(..., description="New status")
     verified_by: Optional[str] = Field(None, description="Who verified the report")
     
@@ -74,19 +91,62 @@ class ReportUpdateRequest(BaseModel):
     @classmethod
     def validate_status(cls, v):
         if isinstance(v, str):
-            try:
-                ReportStatus(v.lower())
-            except ValueError:
-                raise ValueError(f"Invalid status. Must be one of: {[s.value for s in ReportStatus]}")
-            return v.lower()
+            v = v.lower()
+            if v not in _STATUS_VALUES:
+                raise ValueError(f"Invalid status. Must be one of: {sorted(_STATUS_VALUES)}")
         return v
 
 
+# Celery worker queue for background validation and reward payment.
+# Enable with CELERY_ENABLED=true and run workers separately:
+#   celery -A api.celery_app worker --concurrency=8
+# When disabled, tasks fall back to in-process FastAPI BackgroundTasks.
+celery_app = Celery(
+    'minesentry',
+    broker=os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0'),
+)
+celery_app.conf.task_serializer = 'json'
+celery_app.conf.accept_content = ['json']
+
+CELERY_ENABLED = os.getenv('CELERY_ENABLED', 'false').lower() == 'true'
+
+
+def schedule_background_task(background_tasks: BackgroundTasks, task, *args):
+    """Dispatch a task to the Celery queue, or in-process when disabled"""
+    if CELERY_ENABLED:
+        task.delay(*args)
+    else:
+        background_tasks.add_task(task, *args)
+
+
 # Global dependencies
 db = None
 bitcoin_rpc = None
+async_bitcoin_rpc = None
 validator = None
 reward_payment = None
+redis_client = None
+
+# How long identical report submissions are deduplicated (seconds)
+REPORT_DEDUP_TTL = int(os.getenv('REPORT_DEDUP_TTL', '600'))
+# Placeholder stored while the first submission is still in flight; it is
+# overwritten with the report id once the insert commits
+REPORT_DEDUP_PENDING = '__pending__'
+
+
+def get_redis():
+    """Get async Redis client for idempotency keys (None if redis is not installed)"""
+    global redis_client
+    if redis_client is None:
+        try:
+            import redis.asyncio as aioredis
+            redis_client = aioredis.from_url(
+                os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+                decode_responses=True
+            )
+        except ImportError:
+            redis_client = False
+    return redis_client or None
 
 
 def get_database():
@@ -105,6 +165,14 @@ def get_bitcoin_rpc():
     return bitcoin_rpc
 
 
+def get_async_bitcoin_rpc():
+    """Get async Bitcoin RPC instance (shared httpx.AsyncClient)"""
+    global async_bitcoin_rpc
+    if async_bitcoin_rpc is None:
+        async_bitcoin_rpc = AsyncBitcoinRPC()
+    return async_bitcoin_rpc
+
+
 def get_validator():
     """Get report validator instance"""
     global validator
@@ -121,29 +189,70 @@ def get_reward_payment():
     return reward_payment
 
 
+# Dependency providers backed by app.state. The singletons are built once
+# in lifespan, so handlers get the shared instances without a per-request
+# None-check or a first-request construction race.
+def db_dependency(request: Request) -> Database:
+    """Dependency: shared Database instance"""
+    return request.app.state.db
+
+
+def async_rpc_dependency(request: Request) -> AsyncBitcoinRPC:
+    """Dependency: shared async Bitcoin RPC client"""
+    return request.app.state.async_bitcoin_rpc
+
+
+def validator_dependency(request: Request) -> ReportValidator:
+    """Dependency: shared report validator"""
+    return request.app.state.validator
+
+
+def reward_payment_dependency(request: Request) -> RewardPayment:
+    """Dependency: shared reward payment handler"""
+    return request.app.state.reward_payment
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown"""
-    # Startup
-    get_database()
-    get_bitcoin_rpc()
-    get_validator()
-    get_reward_payment()
+    # Route log records through a queue so formatting and stdout writes
+    # happen on a listener thread instead of blocking the event loop
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler()
+    )
+    log_listener.start()
+    root_logger = logging.getLogger()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+    if root_logger.level > logging.INFO or root_logger.level == logging.NOTSET:
+        root_logger.setLevel(logging.INFO)
+
+    # Startup: build shared singletons once and expose them on app.state
+    app.state.db = get_database()
+    app.state.bitcoin_rpc = get_bitcoin_rpc()
+    app.state.async_bitcoin_rpc = get_async_bitcoin_rpc()
+    app.state.validator = get_validator()
+    app.state.reward_payment = get_reward_payment()
     
     # Initialize integration bridge
     try:
         from integration_bridge import get_integration
         integration = get_integration()
-        print("✅ Integration bridge initialized")
+        logger.info("Integration bridge initialized")
         if integration.bounty_contract:
-            print("✅ Bounty contract initialized")
+            logger.info("Bounty contract initialized")
     except Exception as e:
-        print(f"⚠️  Integration initialization warning: {e}")
+        logger.warning("Integration initialization warning: %s", e)
     
     yield
-    
-    # Shutdown (if needed)
-    pass
+
+    # Shutdown
+    if async_bitcoin_rpc is not None:
+        await async_bitcoin_rpc.close()
+
+    root_logger.removeHandler(queue_handler)
+    log_listener.stop()
 
 
 # Initialize FastAPI app
@@ -151,19 +260,91 @@ app = FastAPI(
     title="MineSentry API",
     description="UTXO Mining Pool Monitor & Reward System",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Allowed CORS origins (comma-separated, '*' allows any origin)
+CORS_ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv('CORS_ALLOWED_ORIGINS', '*').split(',')
+    if origin.strip()
 )
 
 
+class CORSPreflightMiddleware:
+    """
+    Minimal ASGI CORS middleware
+
+    Answers OPTIONS preflight requests directly with a 204 before they
+    reach the rest of the middleware stack, and injects CORS headers on
+    normal responses. Much lighter than the full CORSMiddleware since the
+    allowed-origin set is a precomputed frozenset and headers are built
+    once at startup.
+    """
+
+    _PREFLIGHT_HEADERS = [
+        (b'access-control-allow-methods', b'GET, POST, PUT, DELETE, OPTIONS'),
+        (b'access-control-allow-headers', b'Content-Type, Authorization'),
+        (b'access-control-allow-credentials', b'true'),
+        (b'access-control-max-age', b'600'),
+    ]
+
+    def __init__(self, app, allowed_origins: frozenset):
+        self.app = app
+        self.allowed_origins = allowed_origins
+        self.allow_any = '*' in allowed_origins
+
+    def _match_origin(self, scope) -> Optional[bytes]:
+        for name, value in scope.get('headers', []):
+            if name == b'origin':
+                if self.allow_any or value.decode('latin-1') in self.allowed_origins:
+                    return value
+                return None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        origin = self._match_origin(scope)
+
+        if scope['method'] == 'OPTIONS' and origin is not None:
+            # Short-circuit preflight without invoking the app
+            await send({
+                'type': 'http.response.start',
+                'status': 204,
+                'headers': [
+                    (b'access-control-allow-origin', origin),
+                    (b'vary', b'Origin'),
+                ] + self._PREFLIGHT_HEADERS,
+            })
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = list(message.get('headers', [])) + [
+                    (b'access-control-allow-origin', origin),
+                    (b'access-control-allow-credentials', b'true'),
+                    (b'vary', b'Origin'),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(CORSPreflightMiddleware, allowed_origins=CORS_ALLOWED_ORIGINS)
+
+# Compress larger responses (report lists, stats, payout history)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -174,38 +355,96 @@ async def root():
     }
 
 
+# /health is hammered by liveness probes; serve a cached block count for
+# a couple of seconds instead of one RPC per probe
+_health_cache = {"expires": 0.0, "payload": None}
+HEALTH_CACHE_TTL = 2.0
+
+
 @app.get("/health")
-async def health_check():
+async def health_check(btc_rpc: AsyncBitcoinRPC = Depends(async_rpc_dependency)):
     """Health check endpoint"""
+    import time
+
+    now = time.monotonic()
+    if _health_cache["payload"] is not None and now < _health_cache["expires"]:
+        return _health_cache["payload"]
+
     try:
-        btc_rpc = get_bitcoin_rpc()
-        block_count = btc_rpc.get_block_count()
-        return {
+        block_count = await btc_rpc.get_block_count()
+        payload = {
             "status": "healthy",
             "bitcoin_node_connected": True,
             "block_height": block_count
         }
     except Exception as e:
-        return {
+        payload = {
             "status": "degraded",
             "bitcoin_node_connected": False,
             "error": str(e)
         }
 
+    _health_cache["payload"] = payload
+    _health_cache["expires"] = now + HEALTH_CACHE_TTL
+    return payload
+
 
 @app.post("/reports", response_model=ReportResponse, status_code=201)
 async def create_report(
     request: ReportCreateRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    db_instance: Database = Depends(db_dependency)
 ):
     """
     Create a new mining pool report
     
     The report will be automatically validated in the background.
     """
-    db_instance = get_database()
+    import hashlib
+    import json
+
+    # Idempotency: a retried identical payload within the dedup window
+    # returns the original report instead of re-inserting and re-running
+    # validation RPC traffic. The key is reserved with SET NX *before*
+    # the insert, so a retry that lands while the original request is
+    # still in flight cannot slip past a get-then-set gap.
+    dedup_key = None
+    reserved = False
+    redis_conn = get_redis()
+    if redis_conn is not None:
+        canonical = json.dumps(request.model_dump(), sort_keys=True, default=str)
+        dedup_key = "report:dedup:" + hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+        try:
+            reserved = bool(await redis_conn.set(
+                dedup_key, REPORT_DEDUP_PENDING, nx=True, ex=REPORT_DEDUP_TTL
+            ))
+        except Exception:
+            # Redis unreachable - skip deduplication
+            dedup_key = None
+
+        if dedup_key is not None and not reserved:
+            try:
+                existing_id = await redis_conn.get(dedup_key)
+            except Exception:
+                existing_id = None
+
+            if existing_id == REPORT_DEDUP_PENDING:
+                # The original submission is still in flight; tell the
+                # client to retry rather than double-submitting
+                raise HTTPException(
+                    status_code=409,
+                    detail="Identical report submission already in progress"
+                )
+            if existing_id:
+                from database import REPORT_BY_ID_STMT
+                async with db_instance.get_async_session() as async_session:
+                    result = await async_session.execute(REPORT_BY_ID_STMT, {"report_id": existing_id})
+                    existing_report = result.scalar_one_or_none()
+                    if existing_report:
+                        return ReportResponse(**existing_report.to_model().to_dict())
+
     session = db_instance.get_session()
-    
+
     try:
         # Create report model
         report = MiningPoolReport()
@@ -221,21 +460,100 @@ async def create_report(
         # Calculate initial bounty
         report.bounty_amount = RewardCalculator.calculate_reward(report)
         
-        # Save to database
+        # Save to database. All column values (id, timestamp, status) are
+        # computed in Python, so no post-insert refresh SELECT is needed.
         from database import MiningPoolReportDB
         db_report = MiningPoolReportDB.from_model(report)
         session.add(db_report)
         session.commit()
-        session.refresh(db_report)
-        
+
+        # Resolve the reservation so retries return this report
+        if dedup_key is not None:
+            try:
+                await redis_conn.set(dedup_key, str(report.report_id), ex=REPORT_DEDUP_TTL)
+            except Exception:
+                pass
+
         # Schedule background validation
-        background_tasks.add_task(validate_report_background, str(report.report_id))
-        
-        # Convert back to domain model for response
-        report = db_report.to_model()
-        
+        schedule_background_task(background_tasks, validate_report_background, str(report.report_id))
+
+        # Build the response from the in-memory model
         return ReportResponse(**report.to_dict())
-        
+
+    except Exception as e:
+        session.rollback()
+        # Drop the reservation so a later retry isn't stuck behind a
+        # placeholder for a report that was never created
+        if reserved:
+            try:
+                await redis_conn.delete(dedup_key)
+            except Exception:
+                pass
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        session.close()
+
+
+@app.post("/reports/bulk", status_code=201)
+async def create_reports_bulk(
+    requests: List[ReportCreateRequest],
+    background_tasks: BackgroundTasks,
+    db_instance: Database = Depends(db_dependency)
+):
+    """
+    Create many reports in a single bulk INSERT
+
+    Uses an executemany-style insert (one statement, one commit) instead
+    of one ORM round-trip per report.
+    """
+    from database import MiningPoolReportDB
+    from sqlalchemy import insert
+
+    if not requests:
+        return {"created": 0, "report_ids": []}
+
+    session = db_instance.get_session()
+
+    try:
+        rows = []
+        report_ids = []
+        for item in requests:
+            report = MiningPoolReport()
+            report.reporter_address = item.reporter_address
+            report.pool_address = item.pool_address
+            report.pool_name = item.pool_name
+            report.block_height = item.block_height
+            report.evidence_type = EvidenceType(item.evidence_type)
+            report.transaction_ids = item.transaction_ids
+            report.block_hash = item.block_hash
+            report.description = item.description
+            report.bounty_amount = RewardCalculator.calculate_reward(report)
+
+            rows.append({
+                'report_id': str(report.report_id),
+                'reporter_address': report.reporter_address,
+                'pool_address': report.pool_address,
+                'pool_name': report.pool_name,
+                'block_height': report.block_height,
+                'evidence_type': report.evidence_type,
+                'transaction_ids': report.transaction_ids or None,
+                'block_hash': report.block_hash,
+                'description': report.description,
+                'timestamp': report.timestamp,
+                'status': report.status,
+                'bounty_amount': report.bounty_amount,
+            })
+            report_ids.append(str(report.report_id))
+
+        session.execute(insert(MiningPoolReportDB), rows)
+        session.commit()
+
+        # Schedule background validation for each new report
+        for report_id in report_ids:
+            schedule_background_task(background_tasks, validate_report_background, report_id)
+
+        return {"created": len(report_ids), "report_ids": report_ids}
+
     except Exception as e:
         session.rollback()
         raise HTTPException(status_code=400, detail=str(e))
@@ -243,7 +561,8 @@ async def create_report(
         session.close()
 
 
-async def validate_report_background(report_id: str):
+@celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def validate_report_background(self, report_id: str):
     """Background task to validate a report and run detection spells"""
     from integration_bridge import get_integration
     
@@ -252,10 +571,10 @@ async def validate_report_background(report_id: str):
     integration = get_integration()
     
     try:
-        from database import MiningPoolReportDB
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
         import json
         
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             return
@@ -314,57 +633,94 @@ async def validate_report_background(report_id: str):
             db_report.status = ReportStatus.PENDING  # Keep pending for manual review
         
         session.commit()
-        print(f"Detection completed for report {report_id}: confidence={detection_results['confidence_score']:.2f}, methods={len(detection_results['detection_methods'])}")
-        
-    except Exception as e:
-        print(f"Error in background validation/detection: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.info(
+            "Detection completed for report %s: confidence=%.2f, methods=%d",
+            report_id,
+            detection_results['confidence_score'],
+            len(detection_results['detection_methods'])
+        )
+        
+    except Exception:
+        logger.exception("Error in background validation/detection")
         session.rollback()
     finally:
         session.close()
 
 
-@app.get("/reports", response_model=List[ReportResponse])
+# response_model intentionally omitted: re-validating each row through
+# ReportResponse roughly doubles the per-row Python cost; the dicts from
+# to_dict() already match the documented shape
+@app.get("/reports", response_model=None)
 async def list_reports(
+    response: Response,
     status: Optional[str] = None,
     limit: int = 100,
-    offset: int = 0
+    cursor: Optional[str] = None,
+    db_instance: Database = Depends(db_dependency)
 ):
-    """List all reports with optional filtering"""
-    db_instance = get_database()
-    session = db_instance.get_session()
-    
-    try:
-        from database import MiningPoolReportDB
-        query = session.query(MiningPoolReportDB)
-        
-        if status:
-            try:
-                status_enum = ReportStatus(status.lower())
-                query = query.filter_by(status=status_enum)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-        
-        reports = query.order_by(MiningPoolReportDB.timestamp.desc()).offset(offset).limit(limit).all()
-        
-        return [ReportResponse(**report.to_model().to_dict()) for report in reports]
-        
-    finally:
-        session.close()
+    """
+    List all reports with optional filtering
+
+    Uses keyset pagination: pass the X-Next-Cursor header value from the
+    previous page as `cursor` to fetch the next page. Unlike OFFSET, this
+    stays fast regardless of how deep into the result set the page is.
+    """
+    from database import MiningPoolReportDB
+    from sqlalchemy import select, tuple_
+    from datetime import datetime
+    import base64
+
+    stmt = select(MiningPoolReportDB)
+
+    if status:
+        try:
+            status_enum = ReportStatus(status.lower())
+            stmt = stmt.where(MiningPoolReportDB.status == status_enum)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+
+    if cursor:
+        try:
+            timestamp_str, _, cursor_report_id = base64.urlsafe_b64decode(
+                cursor.encode()
+            ).decode().partition('|')
+            cursor_timestamp = datetime.fromisoformat(timestamp_str)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(
+            tuple_(MiningPoolReportDB.timestamp, MiningPoolReportDB.report_id)
+            < (cursor_timestamp, cursor_report_id)
+        )
+
+    stmt = stmt.order_by(
+        MiningPoolReportDB.timestamp.desc(),
+        MiningPoolReportDB.report_id.desc()
+    ).limit(limit)
+
+    async with db_instance.get_async_session() as session:
+        result = await session.execute(stmt)
+        reports = result.scalars().all()
+
+        if len(reports) == limit:
+            last = reports[-1]
+            next_cursor = base64.urlsafe_b64encode(
+                f"{last.timestamp.isoformat()}|{last.report_id}".encode()
+            ).decode()
+            response.headers["X-Next-Cursor"] = next_cursor
+
+        return [report.to_model().to_dict() for report in reports]
 
 
 @app.get("/reports/{report_id}", response_model=ReportResponse)
-async def get_report(report_id: str):
+async def get_report(report_id: str, db_instance: Database = Depends(db_dependency)):
     """Get a specific report by ID"""
-    db_instance = get_database()
-    session = db_instance.get_session()
-    
-    try:
-        from database import MiningPoolReportDB
-        import json
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
-        
+    from database import REPORT_BY_ID_STMT
+    import json
+
+    async with db_instance.get_async_session() as session:
+        result = await session.execute(REPORT_BY_ID_STMT, {"report_id": report_id})
+        db_report = result.scalar_one_or_none()
+
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
         
@@ -389,24 +745,20 @@ async def get_report(report_id: str):
         # Add detection results to response if available
         if detection_results:
             report_dict['detection_results'] = detection_results
-        
+
         return ReportResponse(**report_dict)
-        
-    finally:
-        session.close()
 
 
 @app.get("/reports/{report_id}/confidence")
-async def get_report_confidence(report_id: str):
+async def get_report_confidence(report_id: str, db_instance: Database = Depends(db_dependency)):
     """Get confidence score and detection results for a report"""
-    db_instance = get_database()
     session = db_instance.get_session()
     
     try:
-        from database import MiningPoolReportDB
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
         import json
         
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -465,16 +817,15 @@ async def get_report_confidence(report_id: str):
 async def update_report_status(
     report_id: str,
     request: ReportUpdateRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    db_instance: Database = Depends(db_dependency)
 ):
     """Update report status (e.g., verify or reject)"""
-    db_instance = get_database()
     session = db_instance.get_session()
-    reward_payment_instance = get_reward_payment()
     
     try:
-        from database import MiningPoolReportDB
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -488,14 +839,92 @@ async def update_report_status(
         if new_status == ReportStatus.VERIFIED:
             db_report.verified_at = datetime.utcnow()
             # Schedule reward payment
-            background_tasks.add_task(pay_reward_background, report_id)
+            schedule_background_task(background_tasks, pay_reward_background, report_id)
         
         session.commit()
         session.refresh(db_report)
         
         report = db_report.to_model()
         return ReportResponse(**report.to_dict())
-        
+
+    except Exception as e:
+        session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        session.close()
+
+
+class ReportStatusBulkItem(BaseModel):
+    """Single entry in a bulk status update"""
+    model_config = {"extra": "forbid", "frozen": True, "str_strip_whitespace": True}
+
+    report_id: str = Field(..., description="Report ID to update")
+    status: str = Field(..., description="New status")
+    verified_by: Optional[str] = Field(None, description="Who verified the report")
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v):
+        if isinstance(v, str):
+            v = v.lower()
+            if v not in _STATUS_VALUES:
+                raise ValueError(f"Invalid status. Must be one of: {sorted(_STATUS_VALUES)}")
+        return v
+
+
+@app.patch("/reports/status")
+async def update_report_statuses_bulk(
+    updates: List[ReportStatusBulkItem],
+    background_tasks: BackgroundTasks,
+    db_instance: Database = Depends(db_dependency)
+):
+    """
+    Update many report statuses in a single transaction
+
+    One request and one commit instead of a round trip and transaction
+    per report. Unknown report IDs are returned in 'not_found' rather
+    than failing the whole batch.
+    """
+    if not updates:
+        return {"updated": 0, "not_found": []}
+
+    session = db_instance.get_session()
+
+    try:
+        from database import MiningPoolReportDB
+        from sqlalchemy import select
+
+        report_ids = [update.report_id for update in updates]
+        db_reports = session.execute(
+            select(MiningPoolReportDB).where(MiningPoolReportDB.report_id.in_(report_ids))
+        ).scalars().all()
+        reports_by_id = {db_report.report_id: db_report for db_report in db_reports}
+
+        now = datetime.utcnow()
+        not_found = []
+        updated = 0
+
+        for update in updates:
+            db_report = reports_by_id.get(update.report_id)
+            if db_report is None:
+                not_found.append(update.report_id)
+                continue
+
+            new_status = ReportStatus(update.status.lower())
+            db_report.status = new_status
+            db_report.verified_by = update.verified_by
+            if new_status == ReportStatus.VERIFIED:
+                db_report.verified_at = now
+                # Schedule reward payment
+                schedule_background_task(background_tasks, pay_reward_background, update.report_id)
+            updated += 1
+
+        session.commit()
+
+        return {"updated": updated, "not_found": not_found}
+
+    except HTTPException:
+        raise
     except Exception as e:
         session.rollback()
         raise HTTPException(status_code=400, detail=str(e))
@@ -504,19 +933,18 @@ async def update_report_status(
 
 
 @app.delete("/reports/{report_id}")
-async def delete_report(report_id: str):
+async def delete_report(report_id: str, db_instance: Database = Depends(db_dependency)):
     """
     Delete a report by ID
     
     Note: Only allows deletion of reports that are not verified.
     Verified reports should not be deleted to maintain audit trail.
     """
-    db_instance = get_database()
     session = db_instance.get_session()
     
     try:
-        from database import MiningPoolReportDB
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -543,15 +971,16 @@ async def delete_report(report_id: str):
         session.close()
 
 
-async def pay_reward_background(report_id: str):
+@celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def pay_reward_background(self, report_id: str):
     """Background task to pay reward"""
     db_instance = get_database()
     session = db_instance.get_session()
     reward_payment_instance = get_reward_payment()
     
     try:
-        from database import MiningPoolReportDB
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             return
@@ -565,22 +994,24 @@ async def pay_reward_background(report_id: str):
                 session.commit()
         
     except Exception as e:
-        print(f"Error paying reward: {e}")
+        logger.error("Error paying reward: %s", e)
         session.rollback()
     finally:
         session.close()
 
 
 @app.post("/reports/{report_id}/validate")
-async def validate_report_endpoint(report_id: str):
+async def validate_report_endpoint(
+    report_id: str,
+    db_instance: Database = Depends(db_dependency),
+    validator_instance: ReportValidator = Depends(validator_dependency)
+):
     """Manually trigger validation for a report"""
-    db_instance = get_database()
     session = db_instance.get_session()
-    validator_instance = get_validator()
     
     try:
-        from database import MiningPoolReportDB
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -610,55 +1041,72 @@ async def validate_report_endpoint(report_id: str):
 
 
 @app.get("/stats")
-async def get_stats():
+async def get_stats(
+    request: Request,
+    response: Response,
+    db_instance: Database = Depends(db_dependency)
+):
     """Get system statistics"""
+    from database import MiningPoolReportDB
+    from sqlalchemy import case, func, select
+    import hashlib
+
     integration = get_integration()
-    db_instance = get_database()
-    session = db_instance.get_session()
-    
-    try:
-        from database import MiningPoolReportDB
-        from sqlalchemy import func
-        
-        total_reports = session.query(func.count(MiningPoolReportDB.report_id)).scalar()
-        verified_reports = session.query(func.count(MiningPoolReportDB.report_id)).filter_by(
-            status=ReportStatus.VERIFIED
-        ).scalar()
-        total_bounty = session.query(func.sum(MiningPoolReportDB.bounty_amount)).filter_by(
-            status=ReportStatus.VERIFIED
-        ).scalar() or 0.0
-        
+
+    # Single conditional-aggregate SELECT: one table pass instead of
+    # one COUNT/SUM round-trip per status
+    stats_stmt = select(
+        func.count(MiningPoolReportDB.report_id).label("total"),
+        func.coalesce(func.sum(case(
+            (MiningPoolReportDB.status == ReportStatus.VERIFIED, 1), else_=0
+        )), 0).label("verified"),
+        func.coalesce(func.sum(case(
+            (MiningPoolReportDB.status == ReportStatus.PENDING, 1), else_=0
+        )), 0).label("pending"),
+        func.coalesce(func.sum(case(
+            (MiningPoolReportDB.status == ReportStatus.REJECTED, 1), else_=0
+        )), 0).label("rejected"),
+        func.coalesce(func.sum(case(
+            (MiningPoolReportDB.status == ReportStatus.VERIFIED, MiningPoolReportDB.bounty_amount),
+            else_=0.0
+        )), 0.0).label("bounty"),
+    )
+
+    async with db_instance.get_async_session() as session:
+        row = (await session.execute(stats_stmt)).one()
+
         stats = {
-            "total_reports": total_reports,
-            "verified_reports": verified_reports,
-            "pending_reports": session.query(func.count(MiningPoolReportDB.report_id)).filter_by(
-                status=ReportStatus.PENDING
-            ).scalar(),
-            "rejected_reports": session.query(func.count(MiningPoolReportDB.report_id)).filter_by(
-                status=ReportStatus.REJECTED
-            ).scalar(),
-            "total_bounty_paid_sats": total_bounty,
-            "total_bounty_paid_btc": total_bounty / 100000000
+            "total_reports": row.total,
+            "verified_reports": row.verified,
+            "pending_reports": row.pending,
+            "rejected_reports": row.rejected,
+            "total_bounty_paid_sats": row.bounty,
+            "total_bounty_paid_btc": row.bounty / 100000000
         }
-        
-        # Add bounty contract stats if available
-        if integration.bounty_contract:
-            contract_state = integration.bounty_contract.get_contract_state()
-            stats["bounty_contract"] = {
-                "available_funds_sats": contract_state["available_funds_sats"],
-                "total_paid_sats": contract_state["total_paid_sats"],
-                "pending_payments": contract_state["pending_payments"]
-            }
-        
-        return stats
-        
-    finally:
-        session.close()
+
+    # Add bounty contract stats if available
+    if integration.bounty_contract:
+        contract_state = integration.bounty_contract.get_contract_state()
+        stats["bounty_contract"] = {
+            "available_funds_sats": contract_state["available_funds_sats"],
+            "total_paid_sats": contract_state["total_paid_sats"],
+            "pending_payments": contract_state["pending_payments"]
+        }
+
+    # ETag so polling dashboards get a body-less 304 when nothing changed
+    etag = hashlib.blake2b(str(stats).encode(), digest_size=16).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+
+    return stats
 
 
 # Bounty Contract Endpoints
 class BountyContractSetupRequest(BaseModel):
     """Request model for setting up bounty contract"""
+    model_config = {"extra": "forbid", "frozen": True}
+
     authorized_signers: List[str] = Field(..., min_length=2, description="List of authorized signer Bitcoin addresses")
     min_signatures: int = Field(2, ge=1, description="Minimum signatures required for payments")
 
@@ -787,6 +1235,8 @@ async def create_bounty_payment(
 
 class BountyPaymentApproveRequest(BaseModel):
     """Request model for approving bounty payment"""
+    model_config = {"extra": "forbid", "frozen": True, "str_strip_whitespace": True}
+
     signer_address: str = Field(..., description="Address of the approving signer")
 
 
@@ -883,32 +1333,37 @@ async def get_bounty_hunters_leaderboard(limit: int = 100):
         
     except Exception as e:
         # Log error but return empty list to prevent frontend errors
-        print(f"Error getting bounty hunters leaderboard: {e}")
+        logger.error("Error getting bounty hunters leaderboard: %s", e)
         return []
 
 
 # Validation/Voting Endpoints
 class ValidatorVoteRequest(BaseModel):
     """Request model for validator voting"""
+    model_config = {"extra": "forbid", "frozen": True, "str_strip_whitespace": True}
+
     validator_address: str = Field(..., description="Validator's Bitcoin address")
     vote_decision: str = Field(..., description="Vote decision: 'confirm' or 'reject'")
     stake_amount_sats: int = Field(..., ge=10000, description="Amount of Bitcoin to stake (minimum 10,000 sats)")
 
 
 @app.post("/reports/{report_id}/vote")
-async def submit_validator_vote(report_id: str, request: ValidatorVoteRequest):
+async def submit_validator_vote(
+    report_id: str,
+    request: ValidatorVoteRequest,
+    db_instance: Database = Depends(db_dependency)
+):
     """
     Submit a validator vote on a report
     
     Validators can vote 'confirm' or 'reject' and must stake Bitcoin.
     The stake is locked until the report is resolved.
     """
-    db_instance = get_database()
     session = db_instance.get_session()
     
     try:
-        from database import MiningPoolReportDB
-        db_report = session.query(MiningPoolReportDB).filter_by(report_id=report_id).first()
+        from database import MiningPoolReportDB, REPORT_BY_ID_STMT
+        db_report = session.execute(REPORT_BY_ID_STMT, {"report_id": report_id}).scalar_one_or_none()
         
         if not db_report:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -958,10 +1413,26 @@ async def submit_validator_vote(report_id: str, request: ValidatorVoteRequest):
 if __name__ == "__main__":
     import uvicorn
     import os
-    
+
     # Get port from environment or use default
     port = int(os.getenv('API_PORT', '8000'))
     host = os.getenv('API_HOST', '0.0.0.0')
-    
-    uvicorn.run(app, host=host, port=port)
+    # Report validation is CPU-bound (checksum verification, coinbase
+    # parsing), so a single worker serializes on the GIL. Default to the
+    # usual 2*cores+1 sizing; each worker runs its own lifespan and
+    # therefore owns its own engine, HTTP client, and connection pools.
+    workers = int(os.getenv('API_WORKERS', str(2 * (os.cpu_count() or 1) + 1)))
+
+    # Explicitly select the uvloop event loop and httptools HTTP parser
+    # (installed via uvicorn[standard]) instead of relying on auto-detection.
+    # For production behind a process manager, the equivalent is:
+    #   gunicorn -k uvicorn.workers.UvicornWorker -w $((2 * $(nproc) + 1)) api:app
+    uvicorn.run(
+        "api:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+    )
 
@@ -2,9 +2,11 @@
 Bitcoin RPC integration for blockchain data access
 """
 
+import logging
 import os
 import json
 import requests
+import httpx
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
@@ -17,6 +19,9 @@ except ImportError:
     pass
 
 
+logger = logging.getLogger('minesentry.bitcoin_rpc')
+
+
 @dataclass
 class BitcoinRPCConfig:
     """Configuration for Bitcoin RPC connection"""
@@ -47,6 +52,12 @@ class BitcoinRPC:
         self.session = requests.Session()
         self.session.auth = (config.rpc_user, config.rpc_password)
         self.session.headers.update({'Content-Type': 'application/json'})
+        # Keep-alive pool sized for concurrent callers (validation runs
+        # checks on threads); the default adapter holds fewer persistent
+        # connections and silently opens new sockets past its cap
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def _call(self, method: str, params: List[Any] = None) -> Dict[str, Any]:
         """
@@ -84,7 +95,48 @@ class BitcoinRPC:
             return result.get('result')
         except requests.exceptions.RequestException as e:
             raise Exception(f"RPC connection error: {str(e)}")
-    
+
+    def _call_batch(self, calls: List[tuple]) -> List[Any]:
+        """
+        Make a batched JSON-RPC call (one HTTP round trip for many methods)
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of results in call order; entries whose RPC call returned
+            an error are None
+        """
+        if not calls:
+            return []
+
+        payload = [
+            {
+                'method': method,
+                'params': params or [],
+                'jsonrpc': '2.0',
+                'id': i
+            }
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        try:
+            response = self.session.post(
+                self.config.rpc_url,
+                json=payload,
+                timeout=self.config.rpc_timeout
+            )
+            response.raise_for_status()
+            results = response.json()
+
+            ordered = sorted(results, key=lambda r: r['id'])
+            return [
+                r.get('result') if r.get('error') is None else None
+                for r in ordered
+            ]
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"RPC connection error: {str(e)}")
+
     def get_blockchain_info(self) -> Dict[str, Any]:
         """Get blockchain information"""
         return self._call('getblockchaininfo')
@@ -110,10 +162,50 @@ class BitcoinRPC:
         block_hash = self.get_block_hash(height)
         return self.get_block(block_hash, verbosity)
     
+    def get_blocks_by_heights(self, heights: List[int], verbosity: int = 1) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get many blocks by height in two batched round trips
+
+        Batches all getblockhash calls into one request, then all getblock
+        calls into a second — 2 round trips total instead of 2 per height.
+
+        Args:
+            heights: Block heights to fetch
+            verbosity: 0=raw hex, 1=json with txids, 2=json with full tx data
+
+        Returns:
+            List of blocks in height order; entries for heights that could
+            not be resolved are None
+        """
+        if not heights:
+            return []
+
+        hashes = self._call_batch([('getblockhash', [h]) for h in heights])
+        blocks = self._call_batch([
+            ('getblock', [block_hash, verbosity])
+            for block_hash in hashes if block_hash is not None
+        ])
+
+        block_iter = iter(blocks)
+        return [
+            next(block_iter) if block_hash is not None else None
+            for block_hash in hashes
+        ]
+
     def get_block_hash(self, height: int) -> str:
         """Get block hash by height"""
         return self._call('getblockhash', [height])
-    
+
+    def get_block_txids(self, block_hash: str) -> List[str]:
+        """
+        Get just the txid list for a block (verbosity=1)
+
+        Much cheaper than a verbosity=2 fetch when only membership checks
+        are needed.
+        """
+        block = self._call('getblock', [block_hash, 1])
+        return block.get('tx', [])
+
     def get_block_header(self, block_hash: str, verbose: bool = True) -> Dict[str, Any]:
         """Get block header"""
         return self._call('getblockheader', [block_hash, verbose])
@@ -178,12 +270,10 @@ class BitcoinRPC:
             True if transaction is in block
         """
         try:
-            block = self.get_block(block_hash, verbosity=2)
-            txids = [tx['txid'] for tx in block.get('tx', [])]
-            return txid in txids
+            return txid in set(self.get_block_txids(block_hash))
         except Exception:
             return False
-    
+
     def get_pool_info_from_coinbase(self, block_hash: str) -> Optional[Dict[str, Any]]:
         """
         Extract mining pool information from coinbase transaction
@@ -195,22 +285,251 @@ class BitcoinRPC:
             Dictionary with pool information if found
         """
         try:
-            block = self.get_block(block_hash, verbosity=2)
+            # Fetch only the txid list, then the coinbase transaction itself,
+            # instead of decoding the full verbosity=2 block
+            txids = self.get_block_txids(block_hash)
+            if not txids:
+                return None
+
+            coinbase_tx = self.get_transaction(txids[0], verbose=True, block_hash=block_hash)
+            coinbase_hex = coinbase_tx.get('hex') if coinbase_tx else None
+            if coinbase_hex:
+                # Parse coinbase data (this is simplified - real parsing needs more work)
+                # Coinbase scriptSig contains extra data that pools often use to identify themselves
+                return {
+                    'txid': coinbase_tx['txid'],
+                    'coinbase_hex': coinbase_hex,
+                }
+        except Exception as e:
+            logger.error("Error extracting pool info: %s", e)
+            return None
+
+        return None
+
+
+class AsyncBitcoinRPC:
+    """
+    Async Bitcoin RPC client built on httpx.AsyncClient
+
+    Used by the FastAPI layer so RPC calls are awaited on the event loop
+    instead of blocking it (or being pushed onto the threadpool). The
+    underlying client keeps connections alive across calls; construct it
+    on application startup and call close() on shutdown.
+    """
+
+    def __init__(self, config: BitcoinRPCConfig = None):
+        """
+        Initialize async Bitcoin RPC client
+
+        Args:
+            config: RPC configuration (defaults to environment variables)
+        """
+        if config is None:
+            config = BitcoinRPCConfig(
+                rpc_url=os.getenv('BITCOIN_RPC_URL', 'http://127.0.0.1:8332'),
+                rpc_user=os.getenv('BITCOIN_RPC_USER', ''),
+                rpc_password=os.getenv('BITCOIN_RPC_PASSWORD', ''),
+            )
+
+        self.config = config
+        self._client = httpx.AsyncClient(
+            auth=(config.rpc_user, config.rpc_password),
+            timeout=config.rpc_timeout,
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+
+    async def close(self):
+        """Close the underlying HTTP client (call on shutdown)"""
+        await self._client.aclose()
+
+    async def _call(self, method: str, params: List[Any] = None) -> Dict[str, Any]:
+        """
+        Make async RPC call to Bitcoin node
+
+        Args:
+            method: RPC method name
+            params: Method parameters
+
+        Returns:
+            RPC response result
+        """
+        if params is None:
+            params = []
+
+        payload = {
+            'method': method,
+            'params': params,
+            'jsonrpc': '2.0',
+            'id': 1
+        }
+
+        try:
+            response = await self._client.post(self.config.rpc_url, json=payload)
+            response.raise_for_status()
+            result = response.json()
+
+            if 'error' in result and result['error'] is not None:
+                raise Exception(f"RPC Error: {result['error']}")
+
+            return result.get('result')
+        except httpx.HTTPError as e:
+            raise Exception(f"RPC connection error: {str(e)}")
+
+    async def _call_batch(self, calls: List[tuple]) -> List[Any]:
+        """
+        Make a batched JSON-RPC call (one HTTP round trip for many methods)
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of results in call order; entries whose RPC call returned
+            an error are None
+        """
+        if not calls:
+            return []
+
+        payload = [
+            {
+                'method': method,
+                'params': params or [],
+                'jsonrpc': '2.0',
+                'id': i
+            }
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        try:
+            response = await self._client.post(self.config.rpc_url, json=payload)
+            response.raise_for_status()
+            results = response.json()
+
+            ordered = sorted(results, key=lambda r: r['id'])
+            return [
+                r.get('result') if r.get('error') is None else None
+                for r in ordered
+            ]
+        except httpx.HTTPError as e:
+            raise Exception(f"RPC connection error: {str(e)}")
+
+    async def get_blockchain_info(self) -> Dict[str, Any]:
+        """Get blockchain information"""
+        return await self._call('getblockchaininfo')
+
+    async def get_block(self, block_hash: str, verbosity: int = 2) -> Dict[str, Any]:
+        """
+        Get block information
+
+        Args:
+            block_hash: Block hash
+            verbosity: 0=raw hex, 1=json with txids, 2=json with full tx data
+        """
+        return await self._call('getblock', [block_hash, verbosity])
+
+    async def get_block_hash(self, height: int) -> str:
+        """Get block hash by height"""
+        return await self._call('getblockhash', [height])
+
+    async def get_blocks_by_heights(self, heights: List[int], verbosity: int = 1) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get many blocks by height in two batched round trips
+
+        Batches all getblockhash calls into one request, then all getblock
+        calls into a second — 2 round trips total instead of 2 per height.
+
+        Args:
+            heights: Block heights to fetch
+            verbosity: 0=raw hex, 1=json with txids, 2=json with full tx data
+
+        Returns:
+            List of blocks in height order; entries for heights that could
+            not be resolved are None
+        """
+        if not heights:
+            return []
+
+        hashes = await self._call_batch([('getblockhash', [h]) for h in heights])
+        blocks = await self._call_batch([
+            ('getblock', [block_hash, verbosity])
+            for block_hash in hashes if block_hash is not None
+        ])
+
+        block_iter = iter(blocks)
+        return [
+            next(block_iter) if block_hash is not None else None
+            for block_hash in hashes
+        ]
+
+    async def get_block_txids(self, block_hash: str) -> List[str]:
+        """
+        Get just the txid list for a block (verbosity=1)
+
+        Much cheaper than a verbosity=2 fetch when only membership checks
+        are needed.
+        """
+        block = await self._call('getblock', [block_hash, 1])
+        return block.get('tx', [])
+
+    async def get_block_count(self) -> int:
+        """Get current block count"""
+        return await self._call('getblockcount')
+
+    async def get_transaction(self, txid: str, verbose: bool = True, block_hash: str = None) -> Dict[str, Any]:
+        """
+        Get transaction information
+
+        Args:
+            txid: Transaction ID
+            verbose: Include decoded transaction
+            block_hash: Optional block hash for confirmation
+        """
+        params = [txid, verbose]
+        if block_hash:
+            params.append(block_hash)
+        return await self._call('getrawtransaction', params)
+
+    async def verify_transaction_in_block(self, txid: str, block_hash: str) -> bool:
+        """
+        Verify if transaction is in a specific block
+
+        Args:
+            txid: Transaction ID
+            block_hash: Block hash
+
+        Returns:
+            True if transaction is in block
+        """
+        try:
+            return txid in set(await self.get_block_txids(block_hash))
+        except Exception:
+            return False
+
+    async def get_pool_info_from_coinbase(self, block_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract mining pool information from coinbase transaction
+
+        Args:
+            block_hash: Block hash
+
+        Returns:
+            Dictionary with pool information if found
+        """
+        try:
+            block = await self.get_block(block_hash, verbosity=2)
             if not block.get('tx'):
                 return None
-            
+
             coinbase_tx = block['tx'][0]  # First transaction is coinbase
             coinbase_hex = coinbase_tx.get('hex')
             if coinbase_hex:
-                # Parse coinbase data (this is simplified - real parsing needs more work)
-                # Coinbase scriptSig contains extra data that pools often use to identify themselves
                 return {
                     'txid': coinbase_tx['txid'],
                     'coinbase_hex': coinbase_hex,
                 }
         except Exception as e:
-            print(f"Error extracting pool info: {e}")
+            logger.error("Error extracting pool info: %s", e)
             return None
-        
+
         return None
 
@@ -2,9 +2,13 @@
 Example client script for interacting with MineSentry API
 """
 
+import asyncio
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class MineSentryClient:
@@ -18,6 +22,24 @@ class MineSentryClient:
             base_url: Base URL of the MineSentry API
         """
         self.base_url = base_url.rstrip('/')
+
+        # One pooled session for every call: keep-alive connections avoid
+        # a fresh TCP+TLS handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def submit_report(
         self,
@@ -58,51 +80,59 @@ class MineSentryClient:
             "description": description
         }
         
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, data=orjson.dumps(payload))
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_report(self, report_id: str) -> dict:
         """Get a specific report by ID"""
         url = f"{self.base_url}/reports/{report_id}"
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
-    def list_reports(self, status: Optional[str] = None, limit: int = 100, offset: int = 0) -> list:
+    def list_reports(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[list, Optional[str]]:
         """
-        List reports
-        
+        List reports (one page, keyset-paginated)
+
         Args:
             status: Filter by status (pending, verified, rejected, under_review)
             limit: Maximum number of reports to return
-            offset: Offset for pagination
-            
+            cursor: Cursor from the previous page (None for the first page)
+
         Returns:
-            List of reports
+            Tuple of (reports, next_cursor); next_cursor is None on the
+            last page, otherwise pass it back to fetch the next page
         """
         url = f"{self.base_url}/reports"
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit}
         if status:
             params["status"] = status
-        
-        response = requests.get(url, params=params)
+        if cursor:
+            params["cursor"] = cursor
+
+        response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content), response.headers.get("X-Next-Cursor")
     
     def get_stats(self) -> dict:
         """Get system statistics"""
         url = f"{self.base_url}/stats"
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def validate_report(self, report_id: str) -> dict:
         """Manually trigger validation for a report"""
         url = f"{self.base_url}/reports/{report_id}/validate"
-        response = requests.post(url)
+        response = self.session.post(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def update_report_status(
         self,
@@ -126,15 +156,162 @@ class MineSentryClient:
         if verified_by:
             payload["verified_by"] = verified_by
         
-        response = requests.patch(url, json=payload)
+        response = self.session.patch(url, data=orjson.dumps(payload))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+
+class AsyncMineSentryClient:
+    """
+    Async client for MineSentry API
+
+    Mirrors MineSentryClient but is awaitable, so callers can overlap
+    requests with asyncio.gather over one shared connection pool:
+
+        async with AsyncMineSentryClient() as client:
+            reports = await asyncio.gather(*(
+                client.submit_report(...) for _ in range(100)
+            ))
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        """
+        Initialize async client
+
+        Args:
+            base_url: Base URL of the MineSentry API
+        """
+        self.base_url = base_url.rstrip('/')
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=100),
+            timeout=30.0
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._client.aclose()
+        self._client = None
+
+    async def submit_report(
+        self,
+        reporter_address: str,
+        pool_address: str,
+        block_height: int,
+        evidence_type: str,
+        transaction_ids: list = None,
+        block_hash: Optional[str] = None,
+        pool_name: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> dict:
+        """Submit a new mining pool report (see MineSentryClient.submit_report)"""
+        payload = {
+            "reporter_address": reporter_address,
+            "pool_address": pool_address,
+            "block_height": block_height,
+            "evidence_type": evidence_type,
+            "transaction_ids": transaction_ids or [],
+            "block_hash": block_hash,
+            "pool_name": pool_name,
+            "description": description
+        }
+
+        response = await self._client.post("/reports", content=orjson.dumps(payload))
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def get_report(self, report_id: str) -> dict:
+        """Get a specific report by ID"""
+        response = await self._client.get(f"/reports/{report_id}")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def list_reports(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[list, Optional[str]]:
+        """List reports (see MineSentryClient.list_reports)"""
+        params = {"limit": limit}
+        if status:
+            params["status"] = status
+        if cursor:
+            params["cursor"] = cursor
+
+        response = await self._client.get("/reports", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content), response.headers.get("X-Next-Cursor")
+
+    async def get_stats(self) -> dict:
+        """Get system statistics"""
+        response = await self._client.get("/stats")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def validate_report(self, report_id: str) -> dict:
+        """Manually trigger validation for a report"""
+        response = await self._client.post(f"/reports/{report_id}/validate")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def update_report_status(
+        self,
+        report_id: str,
+        status: str,
+        verified_by: Optional[str] = None
+    ) -> dict:
+        """Update report status (see MineSentryClient.update_report_status)"""
+        payload = {"status": status}
+        if verified_by:
+            payload["verified_by"] = verified_by
+
+        response = await self._client.patch(f"/reports/{report_id}/status", content=orjson.dumps(payload))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+
+async def async_main():
+    """Example concurrent usage of the async client"""
+    print("=== MineSentry Async Client Example ===\n")
+
+    async with AsyncMineSentryClient() as client:
+        # Fan out several submissions in one gather: they share the
+        # connection pool and complete in roughly one round-trip time
+        try:
+            reports = await asyncio.gather(*(
+                client.submit_report(
+                    reporter_address="bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh",
+                    pool_address="bc1q...",
+                    block_height=800000 + i,
+                    evidence_type="censorship",
+                    transaction_ids=["abc123...", "def456..."],
+                    description=f"Concurrent example report #{i}"
+                )
+                for i in range(5)
+            ))
+            print(f"Submitted {len(reports)} reports concurrently")
+        except Exception as e:
+            print(f"Error: {e}\n")
+
+        try:
+            stats = await client.get_stats()
+            print(json.dumps(stats, indent=2))
+        except Exception as e:
+            print(f"Error: {e}\n")
 
 
 def main():
     """Example usage"""
-    client = MineSentryClient()
-    
+    with MineSentryClient() as client:
+        _run_examples(client)
+
+
+def _run_examples(client: "MineSentryClient"):
     print("=== MineSentry Client Example ===\n")
     
     # Get stats
@@ -165,7 +342,7 @@ def main():
     # List reports
     print("\n3. Listing recent reports...")
     try:
-        reports = client.list_reports(limit=5)
+        reports, _next_cursor = client.list_reports(limit=5)
         print(f"Found {len(reports)} reports")
         for report in reports:
             print(f"  - {report['report_id'][:8]}... | {report['status']} | Block {report['block_height']}")
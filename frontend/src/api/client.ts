@@ -54,13 +54,18 @@ export const apiClient = {
   },
 
   // Reports
+  // Keyset-paginated: pass nextCursor from the previous page as cursor
+  // to fetch the next one (null on the last page)
   async getReports(params?: {
     status?: string
     limit?: number
-    offset?: number
-  }): Promise<MiningPoolReport[]> {
-    const { data } = await api.get('/reports', { params })
-    return data
+    cursor?: string
+  }): Promise<{ reports: MiningPoolReport[]; nextCursor: string | null }> {
+    const response = await api.get('/reports', { params })
+    return {
+      reports: response.data,
+      nextCursor: response.headers['x-next-cursor'] ?? null,
+    }
   },
 
   async getReport(reportId: string): Promise<MiningPoolReport> {
@@ -30,9 +30,10 @@ export default function Dashboard() {
 
   const { data: reports, isLoading: reportsLoading } = useQuery({
     queryKey: ['reports', 'recent'],
-    queryFn: () => {
+    queryFn: async () => {
       // Use real reports from API for both demo and non-demo modes
-      return apiClient.getReports({ limit: 5 })
+      const { reports } = await apiClient.getReports({ limit: 5 })
+      return reports
     },
   })
 
@@ -25,9 +25,12 @@ export default function Reports() {
 
   const { data: reports, isLoading } = useQuery({
     queryKey: ['reports', statusFilter === 'all' ? null : statusFilter],
-    queryFn: () => {
+    queryFn: async () => {
       // Use real reports from API for both demo and non-demo modes
-      return apiClient.getReports({ status: statusFilter === 'all' ? undefined : statusFilter })
+      const { reports } = await apiClient.getReports({
+        status: statusFilter === 'all' ? undefined : statusFilter,
+      })
+      return reports
     },
   })
 
@@ -23,16 +23,18 @@ def main():
     print("="*60)
     
     try:
-        # Get integration instance
+        # Get integration instance; bind the contract once so repeated
+        # lookups below don't re-traverse the integration
         integration = get_integration()
-        
-        if not integration.bounty_contract:
+        contract = integration.bounty_contract
+
+        if not contract:
             print("\n❌ Bounty contract is not initialized!")
             print("   Please run setup_bounty_contract.py first.")
             sys.exit(1)
         
         # Get current state
-        state = integration.bounty_contract.get_contract_state()
+        state = contract.get_contract_state()
         print(f"\nContract ID: {state['contract_id']}")
         print(f"Current available funds: {state['available_funds_sats']:,} sats ({state['available_funds_sats']/100000000:.8f} BTC)")
         print(f"Total funded: {state['total_funded_sats']:,} sats ({state['total_funded_sats']/100000000:.8f} BTC)")
@@ -68,10 +70,10 @@ def main():
         # Fund the contract
         print("\n📤 Funding contract...")
         try:
-            integration.bounty_contract.fund_contract(amount_sats)
+            contract.fund_contract(amount_sats)
             
             # Get updated state
-            state = integration.bounty_contract.get_contract_state()
+            state = contract.get_contract_state()
             print("\n✅ Contract funded successfully!")
             print(f"   New available funds: {state['available_funds_sats']:,} sats ({state['available_funds_sats']/100000000:.8f} BTC)")
             print(f"   Total funded: {state['total_funded_sats']:,} sats ({state['total_funded_sats']/100000000:.8f} BTC)")
@@ -7,6 +7,7 @@ when submitting test reports.
 """
 
 import sys
+from itertools import islice
 from bitcoin_rpc import BitcoinRPC
 from dotenv import load_dotenv
 load_dotenv()
@@ -36,17 +37,25 @@ def get_testnet_data():
         print(f"Fetching block at height: {test_height:,}")
         print("")
         
-        block_hash = rpc.get_block_hash(test_height)
-        block = rpc.get_block(block_hash, verbosity=2)
-        
+        # Batched fetch: one round trip for the hash, one for the block,
+        # instead of two sequential RPC calls. verbosity=1 returns just
+        # the txid list — kilobytes instead of the megabytes of full
+        # transaction data we were discarding.
+        block = rpc.get_blocks_by_heights([test_height], verbosity=1)[0]
+        if block is None:
+            print(f"❌ Could not fetch block at height {test_height}")
+            return None
+        block_hash = block['hash']
+
         print(f"✅ Block found!")
         print(f"   Block Height: {block.get('height', test_height):,}")
         print(f"   Block Hash: {block_hash}")
         print(f"   Number of transactions: {len(block.get('tx', []))}")
         print("")
         
-        # Get some transaction IDs (skip coinbase)
-        txids = [tx['txid'] for tx in block.get('tx', [])[1:6]]  # Get 5 non-coinbase txs
+        # Get some transaction IDs (skip coinbase); islice avoids copying
+        # the potentially thousands-long tx list just to take 5 entries
+        txids = list(islice(block.get('tx', ()), 1, 6))  # Get 5 non-coinbase txs
         
         print("📝 Transaction IDs from this block:")
         for i, txid in enumerate(txids, 1):
@@ -8,15 +8,22 @@ This module provides a unified interface for:
 - Payment processing
 """
 
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple, Any
-from models import MiningPoolReport, EvidenceType, ReportStatus
+from models import MiningPoolReport, EvidenceType, ReportStatus, _EVIDENCE_LOOKUP, _STATUS_LOOKUP
 from bitcoin_rpc import BitcoinRPC
 from validation import ReportValidator, CharmsValidator
 from spells.censorship_detection import CensorshipDetectionSpell
 from spells.bounty_contract import BountyContract, PaymentStatus
-from database import Database
+from database import Database, MiningPoolReportDB, REPORT_BY_ID_STMT
 from reward_system import RewardCalculator
+from datetime import datetime
+from itertools import islice
+from sqlalchemy import case, func, insert, select, update
+import functools
 import os
+import threading
+import time
 
 
 class MineSentryIntegration:
@@ -73,6 +80,55 @@ class MineSentryIntegration:
         
         # Initialize reward calculator
         self.reward_calculator = RewardCalculator()
+
+        # Short-TTL cache for get_system_status (dashboards poll it every
+        # couple of seconds) and a per-id cache for report reads. Both
+        # are TTL-bounded: rows can change through sessions that never go
+        # through this bridge (API status updates, background
+        # validation), so entries must expire rather than live until a
+        # bridge write evicts them
+        self._status_cache = None  # (expires_at, status_dict)
+        self._status_cache_lock = threading.Lock()
+        self._report_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    _STATUS_CACHE_TTL = 3.0
+    _REPORT_CACHE_TTL = 3.0
+
+    def _invalidate_caches(self, report_id: str = None):
+        """Drop cached status (and optionally one cached report) after a write"""
+        with self._status_cache_lock:
+            self._status_cache = None
+        if report_id is not None:
+            self._report_cache.pop(report_id, None)
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Run several integration calls in one session and transaction
+
+        Each method normally checks out its own connection and commits —
+        a submit/validate/verify/pay workflow pays four checkouts and
+        four commit fsyncs. Pass the yielded session into the methods to
+        collapse that into one transaction:
+
+            with integration.unit_of_work() as session:
+                integration.validate_report(report_id, session=session)
+                integration.verify_report(report_id, 'admin', session=session)
+
+        Commits on clean exit, rolls back on exception, and drops the
+        read caches after the commit.
+        """
+        session = self.database.get_session()
+        try:
+            yield session
+            session.commit()
+            self._invalidate_caches()
+            self._report_cache.clear()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
     
     def submit_report(
         self,
@@ -83,7 +139,8 @@ class MineSentryIntegration:
         transaction_ids: List[str] = None,
         block_hash: Optional[str] = None,
         pool_name: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        session=None
     ) -> Dict[str, Any]:
         """
         Submit a new mining pool report
@@ -97,6 +154,7 @@ class MineSentryIntegration:
             block_hash: Optional block hash
             pool_name: Optional pool name
             description: Optional description
+            session: Optional session from unit_of_work (caller commits)
             
         Returns:
             Dictionary with report data and submission result
@@ -116,16 +174,19 @@ class MineSentryIntegration:
         report.bounty_amount = self.reward_calculator.calculate_reward(report)
         
         # Save to database
-        session = self.database.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.database.get_session()
         try:
-            from database import MiningPoolReportDB
             db_report = MiningPoolReportDB.from_model(report)
             session.add(db_report)
-            session.commit()
-            session.refresh(db_report)
-            
-            report = db_report.to_model()
-            
+            if owns_session:
+                session.commit()
+                self._invalidate_caches()
+
+            # No refresh: every field in the response (id, status, bounty)
+            # was generated client-side, so reading the row back is a
+            # wasted SELECT on the hottest write path
             return {
                 'success': True,
                 'report_id': str(report.report_id),
@@ -134,6 +195,8 @@ class MineSentryIntegration:
                 'message': 'Report submitted successfully'
             }
         except Exception as e:
+            if not owns_session:
+                raise
             session.rollback()
             return {
                 'success': False,
@@ -141,12 +204,111 @@ class MineSentryIntegration:
                 'message': 'Failed to submit report'
             }
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
+    def submit_reports_bulk(self, reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit many reports in one transaction
+
+        Each entry takes the same keys as submit_report's arguments.
+        Rows are written with chunked executemany inserts (500 rows per
+        statement, clear of SQLite's parameter cap) and a single commit,
+        instead of an add/commit/refresh cycle per report.
+
+        Args:
+            reports: List of report dictionaries
+
+        Returns:
+            Dictionary with the created report IDs and submission result
+        """
+        if not reports:
+            return {'success': True, 'created': 0, 'report_ids': []}
+
+        rows = []
+        report_ids = []
+        models = []
+        for entry in reports:
+            # JSON-shaped entries carry enum value strings; normalize the
+            # same way MiningPoolReport.from_dict does, and refuse unknown
+            # values rather than silently mispricing them as OTHER
+            evidence_type = entry['evidence_type']
+            if not isinstance(evidence_type, EvidenceType):
+                try:
+                    evidence_type = _EVIDENCE_LOOKUP[evidence_type]
+                except KeyError:
+                    raise ValueError(f"Unknown evidence_type: {evidence_type!r}")
+            status = entry.get('status', ReportStatus.PENDING)
+            if not isinstance(status, ReportStatus):
+                try:
+                    status = _STATUS_LOOKUP[status]
+                except KeyError:
+                    raise ValueError(f"Unknown status: {status!r}")
+
+            report = MiningPoolReport()
+            report.reporter_address = entry['reporter_address']
+            report.pool_address = entry['pool_address']
+            report.block_height = entry['block_height']
+            report.evidence_type = evidence_type
+            report.status = status
+            report.transaction_ids = entry.get('transaction_ids') or []
+            report.block_hash = entry.get('block_hash')
+            report.pool_name = entry.get('pool_name')
+            report.description = entry.get('description')
+            models.append(report)
+
+        # Batched reward pass instead of a method call per row
+        bounties = self.reward_calculator.calculate_rewards(models)
+        for report, bounty in zip(models, bounties):
+            report.bounty_amount = bounty
+            rows.append({
+                'report_id': str(report.report_id),
+                'reporter_address': report.reporter_address,
+                'pool_address': report.pool_address,
+                'pool_name': report.pool_name,
+                'block_height': report.block_height,
+                'evidence_type': report.evidence_type,
+                'transaction_ids': report.transaction_ids or None,
+                'block_hash': report.block_hash,
+                'description': report.description,
+                'timestamp': report.timestamp,
+                'status': report.status,
+                'bounty_amount': report.bounty_amount,
+            })
+            report_ids.append(str(report.report_id))
+
+        session = self.database.get_session()
+        try:
+            row_iter = iter(rows)
+            while True:
+                chunk = list(islice(row_iter, 500))
+                if not chunk:
+                    break
+                session.execute(insert(MiningPoolReportDB.__table__), chunk)
+            session.commit()
+            self._invalidate_caches()
+
+            return {
+                'success': True,
+                'created': len(report_ids),
+                'report_ids': report_ids,
+                'message': f'{len(report_ids)} reports submitted successfully'
+            }
+        except Exception as e:
+            session.rollback()
+            return {
+                'success': False,
+                'error': str(e),
+                'message': 'Failed to submit reports'
+            }
+        finally:
+            session.close()
+
     def validate_report(
         self,
         report_id: str,
-        use_spells: bool = True
+        use_spells: bool = True,
+        session=None
     ) -> Dict[str, Any]:
         """
         Validate a report using validation system and spells
@@ -154,14 +316,16 @@ class MineSentryIntegration:
         Args:
             report_id: Report ID to validate
             use_spells: Whether to use Charms spells for validation
+            session: Optional session from unit_of_work (caller commits)
             
         Returns:
             Dictionary with validation results
         """
         # Get report from database
-        session = self.database.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.database.get_session()
         try:
-            from database import MiningPoolReportDB
             db_report = session.query(MiningPoolReportDB).filter_by(
                 report_id=report_id
             ).first()
@@ -180,35 +344,45 @@ class MineSentryIntegration:
                 use_spells=use_spells
             )
             
-            # Update report status
-            if is_valid:
-                db_report.status = ReportStatus.UNDER_REVIEW
-            else:
-                db_report.status = ReportStatus.REJECTED
+            # Update report status with a direct UPDATE — skips the ORM
+            # dirty-check and flush for a single-column write
+            new_status = ReportStatus.UNDER_REVIEW if is_valid else ReportStatus.REJECTED
+            table = MiningPoolReportDB.__table__
+            session.execute(
+                update(table)
+                .where(table.c.report_id == report_id)
+                .values(status=new_status)
+            )
             
-            session.commit()
+            if owns_session:
+                session.commit()
+                self._invalidate_caches(report_id)
             
             return {
                 'success': True,
                 'valid': is_valid,
                 'message': message,
                 'validation_data': validation_data,
-                'status': db_report.status.value
+                'status': new_status.value
             }
             
         except Exception as e:
+            if not owns_session:
+                raise
             session.rollback()
             return {
                 'success': False,
                 'error': str(e)
             }
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def verify_report(
         self,
         report_id: str,
-        verified_by: str
+        verified_by: str,
+        session=None
     ) -> Dict[str, Any]:
         """
         Manually verify a report (move to VERIFIED status)
@@ -216,26 +390,35 @@ class MineSentryIntegration:
         Args:
             report_id: Report ID to verify
             verified_by: Who verified the report
+            session: Optional session from unit_of_work (caller commits)
             
         Returns:
             Dictionary with verification result
         """
-        session = self.database.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.database.get_session()
         try:
-            from database import MiningPoolReportDB
-            db_report = session.query(MiningPoolReportDB).filter_by(
-                report_id=report_id
-            ).first()
+            # One UPDATE instead of load-modify-commit: the row is never
+            # read, so there is no SELECT and no identity-map entry, and
+            # rowcount doubles as the existence check
+            table = MiningPoolReportDB.__table__
+            result = session.execute(
+                update(table)
+                .where(table.c.report_id == report_id)
+                .values(
+                    status=ReportStatus.VERIFIED,
+                    verified_by=verified_by,
+                    verified_at=datetime.utcnow()
+                )
+            )
             
-            if not db_report:
+            if result.rowcount == 0:
                 return {'success': False, 'error': 'Report not found'}
             
-            db_report.status = ReportStatus.VERIFIED
-            db_report.verified_by = verified_by
-            from datetime import datetime
-            db_report.verified_at = datetime.utcnow()
-            
-            session.commit()
+            if owns_session:
+                session.commit()
+                self._invalidate_caches(report_id)
             
             return {
                 'success': True,
@@ -245,15 +428,19 @@ class MineSentryIntegration:
             }
             
         except Exception as e:
+            if not owns_session:
+                raise
             session.rollback()
             return {'success': False, 'error': str(e)}
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def create_bounty_payment(
         self,
         report_id: str,
-        recipient_address: Optional[str] = None
+        recipient_address: Optional[str] = None,
+        session=None
     ) -> Dict[str, Any]:
         """
         Create a bounty payment request for a verified report
@@ -261,6 +448,7 @@ class MineSentryIntegration:
         Args:
             report_id: Verified report ID
             recipient_address: Optional recipient address (uses reporter address if None)
+            session: Optional session from unit_of_work
             
         Returns:
             Dictionary with payment creation result
@@ -272,9 +460,10 @@ class MineSentryIntegration:
             }
         
         # Get report from database
-        session = self.database.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.database.get_session()
         try:
-            from database import MiningPoolReportDB
             db_report = session.query(MiningPoolReportDB).filter_by(
                 report_id=report_id
             ).first()
@@ -311,12 +500,15 @@ class MineSentryIntegration:
             }
             
         except Exception as e:
+            if not owns_session:
+                raise
             return {
                 'success': False,
                 'error': str(e)
             }
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def approve_bounty_payment(
         self,
@@ -415,80 +607,89 @@ class MineSentryIntegration:
         Returns:
             Dictionary with system status information
         """
-        session = self.database.get_session()
-        try:
-            from database import MiningPoolReportDB
-            from sqlalchemy import func
-            
-            total_reports = session.query(func.count(MiningPoolReportDB.report_id)).scalar()
-            verified_reports = session.query(func.count(MiningPoolReportDB.report_id)).filter_by(
-                status=ReportStatus.VERIFIED
-            ).scalar()
-            
-            # Get bounty contract status
-            contract_status = None
-            if self.bounty_contract:
-                contract_status = self.bounty_contract.get_contract_state()
-            
-            # Get detailed Bitcoin node information
-            rpc_url = None
-            if self.bitcoin_rpc:
-                rpc_url = getattr(self.bitcoin_rpc.config, 'rpc_url', 'http://127.0.0.1:8332')
-            
-            bitcoin_info = {
-                'connected': False,
-                'block_height': None,
-                'network': None,
-                'chain': None,
-                'verification_progress': None,
-                'difficulty': None,
-                'blocks': None,
-                'connections': None,
-                'rpc_url': rpc_url,
-            }
-            
-            if self.bitcoin_rpc:
-                try:
-                    blockchain_info = self.bitcoin_rpc.get_blockchain_info()
-                    bitcoin_info = {
-                        'connected': True,
-                        'block_height': blockchain_info.get('blocks'),
-                        'blocks': blockchain_info.get('blocks'),
-                        'network': blockchain_info.get('chain'),  # main, test, regtest
-                        'chain': blockchain_info.get('chain'),
-                        'verification_progress': blockchain_info.get('verificationprogress', 0),
-                        'difficulty': blockchain_info.get('difficulty'),
-                        'connections': blockchain_info.get('connections', 0),
-                        'rpc_url': rpc_url,
-                        'best_block_hash': blockchain_info.get('bestblockhash'),
-                        'chain_work': blockchain_info.get('chainwork'),
-                        'size_on_disk': blockchain_info.get('size_on_disk', 0),
-                        'pruned': blockchain_info.get('pruned', False),
-                        'initial_block_download': blockchain_info.get('initialblockdownload', False),
-                    }
-                except Exception as e:
-                    # If RPC fails, mark as disconnected but keep rpc_url
-                    bitcoin_info['connected'] = False
-                    bitcoin_info['error'] = str(e)
-                    bitcoin_info['rpc_url'] = rpc_url
-            
-            return {
-                'system': 'MineSentry',
-                'bitcoin_rpc': bitcoin_info,
-                'database': {
+        with self._status_cache_lock:
+            if self._status_cache and self._status_cache[0] > time.monotonic():
+                return self._status_cache[1]
+
+
+        # Single Core round trip with a conditional aggregate: no ORM
+        # machinery, one query instead of two COUNTs
+        reports_table = MiningPoolReportDB.__table__
+        counts_stmt = select(
+            func.count(),
+            func.sum(case((reports_table.c.status == ReportStatus.VERIFIED, 1), else_=0)),
+        ).select_from(reports_table)
+
+        with self.database.engine.connect() as conn:
+            total_reports, verified_reports = conn.execute(counts_stmt).one()
+        verified_reports = verified_reports or 0
+
+        # Get bounty contract status
+        contract_status = None
+        if self.bounty_contract:
+            contract_status = self.bounty_contract.get_contract_state()
+        
+        # Get detailed Bitcoin node information
+        rpc_url = None
+        if self.bitcoin_rpc:
+            rpc_url = getattr(self.bitcoin_rpc.config, 'rpc_url', 'http://127.0.0.1:8332')
+        
+        bitcoin_info = {
+            'connected': False,
+            'block_height': None,
+            'network': None,
+            'chain': None,
+            'verification_progress': None,
+            'difficulty': None,
+            'blocks': None,
+            'connections': None,
+            'rpc_url': rpc_url,
+        }
+        
+        if self.bitcoin_rpc:
+            try:
+                blockchain_info = self.bitcoin_rpc.get_blockchain_info()
+                bitcoin_info = {
                     'connected': True,
-                    'total_reports': total_reports,
-                    'verified_reports': verified_reports
-                },
-                'spells': {
-                    'censorship_detection': True,
-                    'bounty_contract': self.bounty_contract is not None
-                },
-                'bounty_contract': contract_status
-            }
-            
-        finally:
-            session.close()
+                    'block_height': blockchain_info.get('blocks'),
+                    'blocks': blockchain_info.get('blocks'),
+                    'network': blockchain_info.get('chain'),  # main, test, regtest
+                    'chain': blockchain_info.get('chain'),
+                    'verification_progress': blockchain_info.get('verificationprogress', 0),
+                    'difficulty': blockchain_info.get('difficulty'),
+                    'connections': blockchain_info.get('connections', 0),
+                    'rpc_url': rpc_url,
+                    'best_block_hash': blockchain_info.get('bestblockhash'),
+                    'chain_work': blockchain_info.get('chainwork'),
+                    'size_on_disk': blockchain_info.get('size_on_disk', 0),
+                    'pruned': blockchain_info.get('pruned', False),
+                    'initial_block_download': blockchain_info.get('initialblockdownload', False),
+                }
+            except Exception as e:
+                # If RPC fails, mark as disconnected but keep rpc_url
+                bitcoin_info['connected'] = False
+                bitcoin_info['error'] = str(e)
+                bitcoin_info['rpc_url'] = rpc_url
+        
+        status = {
+            'system': 'MineSentry',
+            'bitcoin_rpc': bitcoin_info,
+            'database': {
+                'connected': True,
+                'total_reports': total_reports,
+                'verified_reports': verified_reports
+            },
+            'spells': {
+                'censorship_detection': True,
+                'bounty_contract': self.bounty_contract is not None
+            },
+            'bounty_contract': contract_status
+        }
+
+        with self._status_cache_lock:
+            self._status_cache = (time.monotonic() + self._STATUS_CACHE_TTL, status)
+
+        return status
     
     def get_report(self, report_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -500,21 +701,42 @@ class MineSentryIntegration:
         Returns:
             Dictionary with report data or None
         """
-        session = self.database.get_session()
-        try:
-            from database import MiningPoolReportDB
-            db_report = session.query(MiningPoolReportDB).filter_by(
-                report_id=report_id
-            ).first()
-            
-            if not db_report:
-                return None
-            
-            report = db_report.to_model()
-            return report.to_dict()
-            
-        finally:
-            session.close()
+        cached = self._report_cache.get(report_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+
+        # Core instead of ORM for this read-only path: no identity map,
+        # no unit-of-work tracking, no to_model round trip — just one row
+        # straight into the response dict
+        with self.database.engine.connect() as conn:
+            row = conn.execute(REPORT_BY_ID_STMT, {'report_id': report_id}).mappings().first()
+
+        if row is None:
+            return None
+
+        result = {
+            'report_id': row['report_id'],
+            'reporter_address': row['reporter_address'],
+            'pool_address': row['pool_address'],
+            'pool_name': row['pool_name'],
+            'block_height': row['block_height'],
+            'evidence_type': row['evidence_type'].value,
+            'transaction_ids': row['transaction_ids'] or [],
+            'block_hash': row['block_hash'],
+            'description': row['description'],
+            'timestamp': row['timestamp'].isoformat() if row['timestamp'] else None,
+            'status': row['status'].value,
+            'bounty_amount': row['bounty_amount'],
+            'verification_txid': row['verification_txid'],
+            'verified_by': row['verified_by'],
+            'verified_at': row['verified_at'].isoformat() if row['verified_at'] else None,
+        }
+        # Bound the cache; report reads cluster on recent ids
+        if len(self._report_cache) >= 1024:
+            self._report_cache.pop(next(iter(self._report_cache)))
+        self._report_cache[report_id] = (time.monotonic() + self._REPORT_CACHE_TTL, result)
+        return result
     
     def run_detection_spell(
         self,
@@ -663,21 +885,18 @@ class MineSentryIntegration:
             }
 
 
-# Global integration instance
-_integration_instance = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_integration() -> MineSentryIntegration:
     """
     Get or create global integration instance
-    
+
+    Memoized: the first call constructs the integration (opening RPC and
+    database connections); every later call is a cache hit.
+
     Returns:
         MineSentryIntegration instance
     """
-    global _integration_instance
-    if _integration_instance is None:
-        _integration_instance = MineSentryIntegration()
-    return _integration_instance
+    return MineSentryIntegration()
 
 
 def reset_integration():
@@ -686,8 +905,7 @@ def reset_integration():
     
     This forces a new integration instance to be created on next get_integration() call
     """
-    global _integration_instance
-    _integration_instance = None
+    get_integration.cache_clear()
 
 
 def initialize_bounty_contract(
@@ -704,20 +922,21 @@ def initialize_bounty_contract(
     Returns:
         Dictionary with initialization result
     """
-    global _integration_instance
-    
     try:
-        # Validate inputs
-        if not authorized_signers or len(authorized_signers) < 2:
+        # Validate and dedupe inputs before touching get_integration():
+        # a cold call there constructs the whole RPC + database stack,
+        # which is wasted work when the arguments are bad anyway
+        signers = list(dict.fromkeys(s.strip() for s in authorized_signers or [] if s.strip()))
+        if len(signers) < 2:
             return {
                 'success': False,
-                'error': 'At least 2 authorized signers are required'
+                'error': 'At least 2 unique authorized signers are required'
             }
         
-        if min_signatures < 1 or min_signatures > len(authorized_signers):
+        if min_signatures < 1 or min_signatures > len(signers):
             return {
                 'success': False,
-                'error': f'Minimum signatures must be between 1 and {len(authorized_signers)}'
+                'error': f'Minimum signatures must be between 1 and {len(signers)}'
             }
         
         # Get or create integration instance
@@ -731,13 +950,11 @@ def initialize_bounty_contract(
             }
         
         # Create new bounty contract
-        from spells.bounty_contract import BountyContract
-        
         contract = BountyContract(
             bitcoin_rpc=integration.bitcoin_rpc,
             contract_id="minesentry_bounty_v1",
             min_signatures=min_signatures,
-            authorized_signers=authorized_signers
+            authorized_signers=signers
         )
         
         # Set contract in integration
@@ -753,7 +970,7 @@ def initialize_bounty_contract(
                 'contract_id': state['contract_id'],
                 'state': state['state'],
                 'min_signatures': min_signatures,
-                'authorized_signers_count': len(authorized_signers),
+                'authorized_signers_count': len(signers),
             }
         }
         
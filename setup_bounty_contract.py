@@ -12,14 +12,21 @@ It guides you through:
 
 import os
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv
 from bitcoin_rpc import BitcoinRPC
-from integration_bridge import get_integration
+from integration_bridge import get_integration, reset_integration
+from spells.bounty_contract import BountyContract
 
 # Load environment variables
 load_dotenv()
 
+# Mainnet address prefixes for the quick format check (bech32 handled
+# separately since it's a 3-char prefix)
+_LEGACY_PREFIXES = frozenset({'1', '3'})
+
 
 def get_or_create_env():
     """Get or create .env file"""
@@ -40,6 +47,7 @@ def get_signers_from_user():
     print("\nEnter signer addresses (one per line, empty line to finish):")
     
     signers = []
+    seen = set()
     while True:
         address = input(f"Signer {len(signers) + 1} address (or press Enter to finish): ").strip()
         if not address:
@@ -49,14 +57,15 @@ def get_signers_from_user():
             break
         
         # Basic address validation (starts with 1, 3, or bc1)
-        if not (address.startswith('1') or address.startswith('3') or address.startswith('bc1')):
+        if not (address.startswith('bc1') or address[:1] in _LEGACY_PREFIXES):
             print("⚠️  Invalid Bitcoin address format. Please try again.")
             continue
         
-        if address in signers:
+        if address in seen:
             print("⚠️  Address already added. Please enter a different address.")
             continue
         
+        seen.add(address)
         signers.append(address)
         print(f"✅ Added signer {len(signers)}: {address}")
     
@@ -94,12 +103,23 @@ def update_env_file(signers, min_signatures):
     env_path = get_or_create_env()
     
     signers_str = ','.join(signers)
+    updates = {
+        'BOUNTY_CONTRACT_SIGNERS': signers_str,
+        'BOUNTY_MIN_SIGNATURES': str(min_signatures),
+    }
     
-    # Update or add BOUNTY_CONTRACT_SIGNERS
-    set_key(str(env_path), 'BOUNTY_CONTRACT_SIGNERS', signers_str)
+    # One read and one write for all keys — dotenv's set_key re-reads
+    # and rewrites the whole file per key
+    lines = [
+        line for line in env_path.read_text().splitlines()
+        if line.split('=', 1)[0].strip() not in updates
+    ]
+    lines.extend(f"{key}='{value}'" for key, value in updates.items())
+    env_path.write_text('\n'.join(lines) + '\n')
     
-    # Update or add BOUNTY_MIN_SIGNATURES
-    set_key(str(env_path), 'BOUNTY_MIN_SIGNATURES', str(min_signatures))
+    # Mirror the values into the live environment so later steps don't
+    # need to re-parse the .env file we just wrote
+    os.environ.update(updates)
     
     print("\n✅ Updated .env file with bounty contract configuration")
     print(f"   BOUNTY_CONTRACT_SIGNERS={signers_str}")
@@ -125,6 +145,29 @@ def test_bitcoin_rpc():
         return None
 
 
+def validate_signers_rpc(rpc, signers):
+    """
+    Validate signer addresses against the node, concurrently
+
+    Fans the validateaddress calls out over a small thread pool so N
+    signers cost about one round trip instead of N sequential ones.
+
+    Returns:
+        Dictionary mapping address -> True/False, or None if the RPC
+        call itself failed
+    """
+    def check(address):
+        try:
+            result = rpc._call('validateaddress', [address])
+            return bool(result and result.get('isvalid'))
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(check, signers))
+    return dict(zip(signers, results))
+
+
 def initialize_contract(rpc, signers, min_signatures):
     """Initialize the bounty contract"""
     print("\n" + "="*60)
@@ -132,8 +175,6 @@ def initialize_contract(rpc, signers, min_signatures):
     print("="*60)
     
     try:
-        from spells.bounty_contract import BountyContract
-        
         contract = BountyContract(
             bitcoin_rpc=rpc,
             contract_id="minesentry_bounty_v1",
@@ -149,21 +190,27 @@ def initialize_contract(rpc, signers, min_signatures):
         print(f"   Authorized Signers: {len(signers)}")
         print(f"   Available Funds: {state['available_funds_sats']:,} sats ({state['available_funds_sats']/100000000:.8f} BTC)")
         
-        return contract
+        return contract, state
     except Exception as e:
         print(f"\n❌ Failed to initialize contract: {e}")
-        import traceback
         traceback.print_exc()
-        return None
+        return None, None
+
 
+def fund_contract_interactive(contract, rpc, state=None):
+    """
+    Interactively fund the contract
 
-def fund_contract_interactive(contract, rpc):
-    """Interactively fund the contract"""
+    Args:
+        state: Contract state already fetched by the caller; queried
+               fresh only when not provided
+    """
     print("\n" + "="*60)
     print("Step 5: Fund the Contract (Optional)")
     print("="*60)
     
-    state = contract.get_contract_state()
+    if state is None:
+        state = contract.get_contract_state()
     print(f"\nCurrent available funds: {state['available_funds_sats']:,} sats ({state['available_funds_sats']/100000000:.8f} BTC)")
     
     fund_choice = input("\nWould you like to fund the contract now? (y/n): ").strip().lower()
@@ -208,11 +255,9 @@ def verify_integration():
     print("="*60)
     
     try:
-        # Reload environment variables
-        load_dotenv(override=True)
-        
-        # Reset integration to force reload
-        from integration_bridge import reset_integration
+        # The environment already carries the values update_env_file
+        # wrote (it mirrors them into os.environ), so no dotenv re-parse
+        # is needed — just rebuild the integration from current state
         reset_integration()
         
         # Get fresh integration instance
@@ -235,7 +280,6 @@ def verify_integration():
             
     except Exception as e:
         print(f"\n❌ Integration verification failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -267,14 +311,23 @@ def main():
             print("\n❌ Cannot proceed without Bitcoin RPC connection.")
             sys.exit(1)
         
+        # Double-check signer addresses against the node now that RPC is up
+        validation = validate_signers_rpc(rpc, signers)
+        for address, is_valid in validation.items():
+            if is_valid is False:
+                print(f"⚠️  Node reports signer address as invalid: {address}")
+            elif is_valid is None:
+                print(f"⚠️  Could not validate signer address via RPC: {address}")
+        
         # Step 5: Initialize contract
-        contract = initialize_contract(rpc, signers, min_signatures)
+        contract, contract_state = initialize_contract(rpc, signers, min_signatures)
         if not contract:
             print("\n❌ Failed to initialize contract.")
             sys.exit(1)
         
-        # Step 6: Fund contract (optional)
-        fund_contract_interactive(contract, rpc)
+        # Step 6: Fund contract (optional); reuse the state fetched at
+        # initialization instead of a second get_contract_state round trip
+        fund_contract_interactive(contract, rpc, state=contract_state)
         
         # Step 7: Verify integration
         verify_success = verify_integration()
@@ -302,7 +355,6 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Setup failed with error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,24 +1,30 @@
 """
 MineSentry Spells - Censorship Detection and Validation Spells
+
+Submodules are imported lazily (PEP 562): `import spells` is free, and
+each symbol pulls in only its own submodule on first access.
 """
 
-from .censorship_detection import CensorshipDetectionSpell
-from .bounty_contract import (
-    BountyContract,
-    BountyContractSpell,
-    BountyPayment,
-    BountyContractState,
-    ContractState,
-    PaymentStatus
-)
+import importlib
+
+_EXPORTS = {
+    'CensorshipDetectionSpell': '.censorship_detection',
+    'BountyContract': '.bounty_contract',
+    'BountyContractSpell': '.bounty_contract',
+    'BountyPayment': '.bounty_contract',
+    'BountyContractState': '.bounty_contract',
+    'ContractState': '.bounty_contract',
+    'PaymentStatus': '.bounty_contract',
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'CensorshipDetectionSpell',
-    'BountyContract',
-    'BountyContractSpell',
-    'BountyPayment',
-    'BountyContractState',
-    'ContractState',
-    'PaymentStatus'
-]
 
+def __getattr__(name):
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(submodule, __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = attr
+    return attr
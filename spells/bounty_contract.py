@@ -12,13 +12,23 @@ Contract Features:
 - On-chain validation
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+
+import orjson
+
 from models import MiningPoolReport, ReportStatus, EvidenceType
 from bitcoin_rpc import BitcoinRPC
 
+# Shared pool for the RPC-bound send_to_address calls in bulk payment
+# execution; sized below bitcoind's default RPC work-queue depth
+_PAYMENT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bounty-payment')
+
 
 class ContractState(Enum):
     """Contract state enumeration"""
@@ -32,12 +42,13 @@ class PaymentStatus(Enum):
     """Payment status enumeration"""
     PENDING = "pending"
     APPROVED = "approved"
+    PROCESSING = "processing"  # Send in flight; claimed by an executor
     PAID = "paid"
     REJECTED = "rejected"
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class BountyPayment:
     """Represents a bounty payment request"""
     payment_id: str
@@ -49,11 +60,21 @@ class BountyPayment:
     approved_at: Optional[datetime] = None
     paid_at: Optional[datetime] = None
     txid: Optional[str] = None
-    approvers: List[str] = field(default_factory=list)
+    approvers: Set[str] = field(default_factory=set)  # Set: O(1) duplicate-approval checks
     rejection_reason: Optional[str] = None
+    # Serialized forms of the immutable fields, computed once here so the
+    # queue/history views don't redo the conversions on every poll;
+    # _approved_at_iso is filled when the approval threshold is reached
+    _created_at_iso: str = field(default='', init=False, repr=False, compare=False)
+    _amount_btc: float = field(default=0.0, init=False, repr=False, compare=False)
+    _approved_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self._created_at_iso = self.created_at.isoformat()
+        self._amount_btc = self.amount_sats / 100000000
 
-@dataclass
+
+@dataclass(slots=True)
 class BountyContractState:
     """State of the bounty contract"""
     contract_id: str
@@ -61,10 +82,18 @@ class BountyContractState:
     total_funded_sats: int = 0
     total_paid_sats: int = 0
     total_reserved_sats: int = 0
+    # Materialized funded - paid - reserved, updated on every transition
+    # that moves funds so reads never recompute it
+    total_available_sats: int = 0
     min_signatures: int = 2  # Multi-sig requirement
     authorized_signers: List[str] = field(default_factory=list)
-    payment_queue: List[BountyPayment] = field(default_factory=list)
-    payment_history: List[BountyPayment] = field(default_factory=list)
+    # payment_id -> queued payment. Dicts preserve insertion order, so this
+    # is still the FIFO queue while giving O(1) lookup and removal
+    payment_queue: Dict[str, BountyPayment] = field(default_factory=dict)
+    # Settled payments, split by outcome so the paid-history view never
+    # has to filter rejected entries out
+    paid_history: List[BountyPayment] = field(default_factory=list)
+    rejected_history: List[BountyPayment] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -77,7 +106,21 @@ class BountyContract:
     verified mining pool reports. It uses multi-signature verification
     and automated payment distribution.
     """
-    
+
+    # Payment calculation parameters. Class-level and covering every
+    # EvidenceType member, so calculate_bounty indexes directly with no
+    # fallback branch (mirrors RewardCalculator.BASE_REWARDS_BY_ENUM).
+    BASE_REWARDS = {
+        EvidenceType.CENSORSHIP: 100000,  # 0.001 BTC
+        EvidenceType.DOUBLE_SPEND_ATTEMPT: 500000,  # 0.005 BTC
+        EvidenceType.SELFISH_MINING: 200000,  # 0.002 BTC
+        EvidenceType.BLOCK_REORDERING: 150000,  # 0.0015 BTC
+        EvidenceType.TRANSACTION_CENSORSHIP: 75000,  # 0.00075 BTC
+        EvidenceType.UNUSUAL_BLOCK_TEMPLATE: 50000,  # 0.0005 BTC
+        EvidenceType.OTHER: 25000,  # 0.00025 BTC
+    }
+
+
     def __init__(
         self,
         bitcoin_rpc: BitcoinRPC,
@@ -98,7 +141,20 @@ class BountyContract:
         self.contract_id = contract_id
         self.min_signatures = min_signatures
         self.authorized_signers = authorized_signers or []
-        
+        # Frozen set view for the per-approval membership checks; the list
+        # above keeps the original order for serialization
+        self._authorized_signers_set = frozenset(self.authorized_signers)
+        # Guards every state mutation: API handlers and payment workers
+        # can hit the same contract concurrently. Reads of individual
+        # counters stay lock-free (GIL-atomic int loads). Reentrant so
+        # wrappers like execute_payment can nest.
+        self._lock = threading.RLock()
+        # Monotonic payment-id sequence: unique by construction, unlike
+        # the old epoch-seconds suffix which collided for two payments
+        # created in the same second. itertools.count is thread-safe
+        # under the GIL.
+        self._payment_seq = itertools.count(1)
+
         # Initialize contract state
         self.state = BountyContractState(
             contract_id=contract_id,
@@ -106,18 +162,11 @@ class BountyContract:
             authorized_signers=self.authorized_signers,
             state=ContractState.ACTIVE
         )
-        
-        # Payment calculation parameters
-        self.base_rewards = {
-            EvidenceType.CENSORSHIP: 100000,  # 0.001 BTC
-            EvidenceType.DOUBLE_SPEND_ATTEMPT: 500000,  # 0.005 BTC
-            EvidenceType.SELFISH_MINING: 200000,  # 0.002 BTC
-            EvidenceType.BLOCK_REORDERING: 150000,  # 0.0015 BTC
-            EvidenceType.TRANSACTION_CENSORSHIP: 75000,  # 0.00075 BTC
-            EvidenceType.UNUSUAL_BLOCK_TEMPLATE: 50000,  # 0.0005 BTC
-            EvidenceType.OTHER: 25000,  # 0.00025 BTC
-        }
-    
+
+        # Kept as an instance alias for callers that tweak reward tables
+        # per contract
+        self.base_rewards = self.BASE_REWARDS
+
     def calculate_bounty(self, report: MiningPoolReport) -> int:
         """
         Calculate bounty amount for a verified report
@@ -128,18 +177,19 @@ class BountyContract:
         Returns:
             Bounty amount in satoshis
         """
-        # Get base reward for evidence type
-        base_reward = self.base_rewards.get(
-            report.evidence_type,
-            self.base_rewards[EvidenceType.OTHER]
-        )
-        
-        # Adjust based on number of transactions provided (more evidence = higher reward)
-        evidence_multiplier = min(1.0 + (len(report.transaction_ids) * 0.1), 2.0)
-        
+        # Get base reward for evidence type; the table has a slot for
+        # every member, so no fallback lookup is needed
+        base_reward = self.base_rewards[report.evidence_type]
+        
+        # Adjust based on number of transactions provided (more evidence
+        # = higher reward). The multiplier has one decimal digit, so work
+        # in tenths: exact integer arithmetic, bit-for-bit reproducible
+        # across nodes, with no float rounding at the reward boundaries
+        multiplier_tenths = min(10 + len(report.transaction_ids), 20)
+
         # Calculate reward
-        reward = int(base_reward * evidence_multiplier)
-        
+        reward = (base_reward * multiplier_tenths) // 10
+
         # Ensure minimum reward
         return max(reward, 10000)  # Minimum 0.0001 BTC
     
@@ -166,32 +216,31 @@ class BountyContract:
         
         # Calculate bounty amount
         amount_sats = self.calculate_bounty(report)
-        
-        # Check if contract has sufficient funds
-        available_funds = (
-            self.state.total_funded_sats -
-            self.state.total_paid_sats -
-            self.state.total_reserved_sats
-        )
-        
-        if amount_sats > available_funds:
-            raise Exception(f"Insufficient funds: need {amount_sats} sats, have {available_funds} sats")
-        
+
         # Create payment request
-        payment_id = f"{self.contract_id}_{report.report_id}_{int(datetime.utcnow().timestamp())}"
+        payment_id = f"{self.contract_id}_{next(self._payment_seq)}"
+        now = datetime.utcnow()
         payment = BountyPayment(
             payment_id=payment_id,
             report_id=str(report.report_id),
             recipient_address=recipient_address,
             amount_sats=amount_sats,
-            status=PaymentStatus.PENDING
+            status=PaymentStatus.PENDING,
+            created_at=now
         )
-        
-        # Reserve funds
-        self.state.total_reserved_sats += amount_sats
-        self.state.payment_queue.append(payment)
-        self.state.updated_at = datetime.utcnow()
-        
+
+        with self._lock:
+            # Check if contract has sufficient funds
+            available_funds = self.state.total_available_sats
+            if amount_sats > available_funds:
+                raise Exception(f"Insufficient funds: need {amount_sats} sats, have {available_funds} sats")
+
+            # Reserve funds
+            self.state.total_reserved_sats += amount_sats
+            self.state.total_available_sats -= amount_sats
+            self.state.payment_queue[payment.payment_id] = payment
+            self.state.updated_at = now
+
         return payment
     
     def approve_payment(
@@ -209,34 +258,37 @@ class BountyContract:
         Returns:
             Tuple of (success, message)
         """
-        if signer_address not in self.authorized_signers:
+        if signer_address not in self._authorized_signers_set:
             return (False, "Unauthorized signer")
-        
-        # Find payment in queue
-        payment = None
-        for p in self.state.payment_queue:
-            if p.payment_id == payment_id:
-                payment = p
-                break
-        
-        if payment is None:
-            return (False, "Payment not found in queue")
-        
-        if payment.status != PaymentStatus.PENDING:
-            return (False, f"Payment already {payment.status.value}")
-        
-        # Add approver if not already approved by this signer
-        if signer_address not in payment.approvers:
-            payment.approvers.append(signer_address)
-        
-        # Check if we have enough signatures
-        if len(payment.approvers) >= self.min_signatures:
-            payment.status = PaymentStatus.APPROVED
-            payment.approved_at = datetime.utcnow()
-            self.state.updated_at = datetime.utcnow()
-            return (True, "Payment approved and ready to pay")
-        
-        return (True, f"Approval added ({len(payment.approvers)}/{self.min_signatures} signatures)")
+
+        with self._lock:
+            # Find payment in queue
+            payment = self.state.payment_queue.get(payment_id)
+
+            if payment is None:
+                return (False, "Payment not found in queue")
+
+            if payment.status != PaymentStatus.PENDING:
+                return (False, f"Payment already {payment.status.value}")
+
+            # A repeat approval changes nothing — bail out before touching
+            # payment or contract state (no spurious updated_at bump)
+            if signer_address in payment.approvers:
+                return (True, f"Already approved ({len(payment.approvers)}/{self.min_signatures} signatures)")
+
+            # Add approver
+            payment.approvers.add(signer_address)
+
+            # Check if we have enough signatures
+            if len(payment.approvers) >= self.min_signatures:
+                now = datetime.utcnow()
+                payment.status = PaymentStatus.APPROVED
+                payment.approved_at = now
+                payment._approved_at_iso = now.isoformat()
+                self.state.updated_at = now
+                return (True, "Payment approved and ready to pay")
+
+            return (True, f"Approval added ({len(payment.approvers)}/{self.min_signatures} signatures)")
     
     def reject_payment(
         self,
@@ -255,83 +307,141 @@ class BountyContract:
         Returns:
             Tuple of (success, message)
         """
-        if signer_address not in self.authorized_signers:
+        if signer_address not in self._authorized_signers_set:
             return (False, "Unauthorized signer")
-        
-        # Find payment in queue
-        payment = None
-        for p in self.state.payment_queue:
-            if p.payment_id == payment_id:
-                payment = p
-                break
-        
-        if payment is None:
-            return (False, "Payment not found in queue")
-        
-        # Reject payment
-        payment.status = PaymentStatus.REJECTED
-        payment.rejection_reason = reason
-        
-        # Release reserved funds
-        self.state.total_reserved_sats -= payment.amount_sats
-        
-        # Move to history
-        self.state.payment_queue.remove(payment)
-        self.state.payment_history.append(payment)
-        self.state.updated_at = datetime.utcnow()
-        
+
+        with self._lock:
+            # Find payment in queue
+            payment = self.state.payment_queue.get(payment_id)
+
+            if payment is None:
+                return (False, "Payment not found in queue")
+
+            # Only pending payments can be rejected: an approved payment
+            # may already be claimed for execution, and rejecting it
+            # would double-release its reserved funds
+            if payment.status != PaymentStatus.PENDING:
+                return (False, f"Payment already {payment.status.value}")
+
+            # Reject payment
+            payment.status = PaymentStatus.REJECTED
+            payment.rejection_reason = reason
+
+            # Release reserved funds
+            self.state.total_reserved_sats -= payment.amount_sats
+            self.state.total_available_sats += payment.amount_sats
+
+            # Move to history
+            del self.state.payment_queue[payment_id]
+            self.state.rejected_history.append(payment)
+            self.state.updated_at = datetime.utcnow()
+
         return (True, "Payment rejected")
     
     def execute_payment(self, payment_id: str) -> Tuple[bool, str, Optional[str]]:
         """
         Execute an approved payment (send Bitcoin)
-        
+
         Args:
             payment_id: Payment request ID
-            
+
         Returns:
             Tuple of (success, message, txid)
         """
-        # Find approved payment
-        payment = None
-        for p in self.state.payment_queue:
-            if p.payment_id == payment_id and p.status == PaymentStatus.APPROVED:
-                payment = p
-                break
-        
-        if payment is None:
-            return (False, "Approved payment not found", None)
-        
-        try:
-            # Send Bitcoin payment
-            amount_btc = payment.amount_sats / 100000000
-            comment = f"MineSentry bounty payment for report {payment.report_id}"
-            
-            txid = self.bitcoin_rpc.send_to_address(
-                payment.recipient_address,
-                amount_btc,
-                comment
-            )
-            
-            # Update payment status
-            payment.status = PaymentStatus.PAID
-            payment.txid = txid
-            payment.paid_at = datetime.utcnow()
-            
-            # Update contract state
-            self.state.total_paid_sats += payment.amount_sats
-            self.state.total_reserved_sats -= payment.amount_sats
-            
-            # Move to history
-            self.state.payment_queue.remove(payment)
-            self.state.payment_history.append(payment)
-            self.state.updated_at = datetime.utcnow()
-            
-            return (True, "Payment executed successfully", txid)
-            
-        except Exception as e:
-            payment.status = PaymentStatus.FAILED
-            return (False, f"Payment failed: {str(e)}", None)
+        return self.execute_payments_bulk([payment_id])[payment_id]
+
+    def execute_payments_bulk(
+        self,
+        payment_ids: List[str]
+    ) -> Dict[str, Tuple[bool, str, Optional[str]]]:
+        """
+        Execute a batch of approved payments (send Bitcoin)
+
+        The send_to_address calls run concurrently on a worker pool, so N
+        payments cost roughly one RPC round trip instead of N. Each
+        payment is claimed (PROCESSING) under the lock before its send is
+        submitted; the queue/accounting updates happen under the lock
+        again once the sends resolve, back on the calling thread.
+
+        Args:
+            payment_ids: Payment request IDs
+
+        Returns:
+            Dictionary mapping payment_id to (success, message, txid)
+        """
+        results = {}
+        to_send = []
+        with self._lock:
+            # Dedupe ids so a repeated id cannot submit a second send
+            for payment_id in dict.fromkeys(payment_ids):
+                # Find approved payment and claim it: flipping the status
+                # to PROCESSING inside the lock means a concurrent
+                # executor (or reject) cannot pick it up while the send
+                # is in flight
+                payment = self.state.payment_queue.get(payment_id)
+                if payment is None or payment.status != PaymentStatus.APPROVED:
+                    results[payment_id] = (False, "Approved payment not found", None)
+                else:
+                    payment.status = PaymentStatus.PROCESSING
+                    to_send.append(payment)
+
+        if not to_send:
+            return results
+
+        # Send Bitcoin payments in parallel
+        futures = {
+            payment.payment_id: _PAYMENT_EXECUTOR.submit(self._send_payment, payment)
+            for payment in to_send
+        }
+
+        # Resolve every send before taking the lock: waiting on the
+        # slowest RPC inside the critical section would stall all other
+        # contract operations for the whole batch
+        send_outcomes = {}
+        for payment_id, future in futures.items():
+            try:
+                send_outcomes[payment_id] = (future.result(), None)
+            except Exception as e:
+                send_outcomes[payment_id] = (None, e)
+
+        now = datetime.utcnow()
+        with self._lock:
+            for payment in to_send:
+                payment_id = payment.payment_id
+                txid, error = send_outcomes[payment_id]
+                if error is not None:
+                    payment.status = PaymentStatus.FAILED
+                    results[payment_id] = (False, f"Payment failed: {str(error)}", None)
+                    continue
+
+                # Update payment status
+                payment.status = PaymentStatus.PAID
+                payment.txid = txid
+                payment.paid_at = now
+
+                # Update contract state (reserved -> paid, so available
+                # funds are unchanged)
+                self.state.total_paid_sats += payment.amount_sats
+                self.state.total_reserved_sats -= payment.amount_sats
+
+                # Move to history
+                self.state.payment_queue.pop(payment_id, None)
+                self.state.paid_history.append(payment)
+                self.state.updated_at = now
+
+                results[payment_id] = (True, "Payment executed successfully", txid)
+
+        return results
+
+    def _send_payment(self, payment: BountyPayment) -> str:
+        """Send the on-chain transaction for a payment (runs on the pool)"""
+        amount_btc = payment.amount_sats / 100000000
+        comment = f"MineSentry bounty payment for report {payment.report_id}"
+        return self.bitcoin_rpc.send_to_address(
+            payment.recipient_address,
+            amount_btc,
+            comment
+        )
     
     def get_contract_state(self) -> Dict[str, Any]:
         """
@@ -340,74 +450,99 @@ class BountyContract:
         Returns:
             Dictionary with contract state information
         """
-        available_funds = (
-            self.state.total_funded_sats -
-            self.state.total_paid_sats -
-            self.state.total_reserved_sats
-        )
-        
         return {
             'contract_id': self.contract_id,
             'state': self.state.state.value,
             'total_funded_sats': self.state.total_funded_sats,
             'total_paid_sats': self.state.total_paid_sats,
             'total_reserved_sats': self.state.total_reserved_sats,
-            'available_funds_sats': available_funds,
+            'available_funds_sats': self.state.total_available_sats,
             'min_signatures': self.min_signatures,
             'authorized_signers': self.authorized_signers,
             'pending_payments': len(self.state.payment_queue),
-            'total_payments': len(self.state.payment_history),
+            'total_payments': len(self.state.paid_history) + len(self.state.rejected_history),
             'created_at': self.state.created_at.isoformat(),
             'updated_at': self.state.updated_at.isoformat(),
         }
-    
-    def get_payment_queue(self) -> List[Dict[str, Any]]:
+
+    def get_contract_state_json(self) -> bytes:
         """
-        Get current payment queue
-        
-        Returns:
-            List of payment request dictionaries
+        Serialize the contract state straight to JSON bytes
+
+        orjson encodes the dict in C; prefer this over
+        json.dumps(get_contract_state()) anywhere the dict itself isn't
+        needed.
         """
-        return [
-            {
+        return orjson.dumps(self.get_contract_state())
+
+    def get_payment_queue_json(self) -> bytes:
+        """Serialize the payment queue view straight to JSON bytes"""
+        return orjson.dumps(self.get_payment_queue())
+
+    def get_payment_history_json(self) -> bytes:
+        """Serialize the paid-payment history straight to JSON bytes"""
+        return orjson.dumps(self.get_payment_history())
+
+    def iter_payment_queue(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the current payment queue lazily
+
+        Yields one dictionary per queued payment; streaming callers
+        (JSON encoders, pagination) get O(1) extra memory instead of a
+        materialized list.
+        """
+        for p in self.state.payment_queue.values():
+            yield {
                 'payment_id': p.payment_id,
                 'report_id': p.report_id,
                 'recipient_address': p.recipient_address,
                 'amount_sats': p.amount_sats,
-                'amount_btc': p.amount_sats / 100000000,
+                'amount_btc': p._amount_btc,
                 'status': p.status.value,
-                'approvers': p.approvers,
+                'approvers': sorted(p.approvers),
                 'approvals': f"{len(p.approvers)}/{self.min_signatures}",
-                'created_at': p.created_at.isoformat(),
-                'approved_at': p.approved_at.isoformat() if p.approved_at else None,
+                'created_at': p._created_at_iso,
+                'approved_at': p._approved_at_iso,
             }
-            for p in self.state.payment_queue
-        ]
-    
-    def get_payment_history(self) -> List[Dict[str, Any]]:
+
+    def get_payment_queue(self) -> List[Dict[str, Any]]:
         """
-        Get payment history (completed payments)
-        
+        Get current payment queue
+
         Returns:
-            List of payment dictionaries with status='paid'
+            List of payment request dictionaries
+        """
+        return list(self.iter_payment_queue())
+
+    def iter_payment_history(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate completed (paid) payments lazily
+
+        Yields one dictionary per paid payment, in payment order.
         """
-        return [
-            {
+        for p in self.state.paid_history:
+            yield {
                 'payment_id': p.payment_id,
                 'report_id': p.report_id,
                 'recipient_address': p.recipient_address,
                 'amount_sats': p.amount_sats,
-                'amount_btc': p.amount_sats / 100000000,
+                'amount_btc': p._amount_btc,
                 'status': p.status.value,
-                'approvers': p.approvers,
+                'approvers': sorted(p.approvers),
                 'txid': p.txid,
-                'created_at': p.created_at.isoformat(),
-                'approved_at': p.approved_at.isoformat() if p.approved_at else None,
+                'created_at': p._created_at_iso,
+                'approved_at': p._approved_at_iso,
                 'paid_at': p.paid_at.isoformat() if p.paid_at else None,
             }
-            for p in self.state.payment_history
-            if p.status == PaymentStatus.PAID
-        ]
+
+    def get_payment_history(self) -> List[Dict[str, Any]]:
+        """
+        Get payment history (completed payments)
+
+        Returns:
+            List of payment dictionaries with status='paid'
+        """
+        return list(self.iter_payment_history())
     
     def fund_contract(self, amount_sats: int) -> bool:
         """
@@ -421,34 +556,39 @@ class BountyContract:
         """
         if amount_sats <= 0:
             return False
-        
-        self.state.total_funded_sats += amount_sats
-        self.state.updated_at = datetime.utcnow()
+
+        with self._lock:
+            self.state.total_funded_sats += amount_sats
+            self.state.total_available_sats += amount_sats
+            self.state.updated_at = datetime.utcnow()
         return True
     
     def pause_contract(self) -> bool:
         """Pause the contract (stop processing new payments)"""
-        if self.state.state == ContractState.ACTIVE:
-            self.state.state = ContractState.PAUSED
-            self.state.updated_at = datetime.utcnow()
-            return True
-        return False
-    
+        with self._lock:
+            if self.state.state == ContractState.ACTIVE:
+                self.state.state = ContractState.PAUSED
+                self.state.updated_at = datetime.utcnow()
+                return True
+            return False
+
     def resume_contract(self) -> bool:
         """Resume the contract"""
-        if self.state.state == ContractState.PAUSED:
-            self.state.state = ContractState.ACTIVE
-            self.state.updated_at = datetime.utcnow()
-            return True
-        return False
-    
+        with self._lock:
+            if self.state.state == ContractState.PAUSED:
+                self.state.state = ContractState.ACTIVE
+                self.state.updated_at = datetime.utcnow()
+                return True
+            return False
+
     def close_contract(self) -> bool:
         """Close the contract (no new payments, existing can be processed)"""
-        if self.state.state in [ContractState.ACTIVE, ContractState.PAUSED]:
-            self.state.state = ContractState.CLOSED
-            self.state.updated_at = datetime.utcnow()
-            return True
-        return False
+        with self._lock:
+            if self.state.state in [ContractState.ACTIVE, ContractState.PAUSED]:
+                self.state.state = ContractState.CLOSED
+                self.state.updated_at = datetime.utcnow()
+                return True
+            return False
 
 
 # Charms Spell Interface
@@ -470,6 +610,14 @@ class BountyContractSpell:
         """
         self.contract = contract
         self.spell_id = None  # Would be set when deployed
+        # Method-name -> handler table; execute_spell_method dispatches
+        # with one dict lookup instead of a string-compare chain, and new
+        # spell methods register here
+        self._dispatch = {
+            'create_payment_request': self._spell_create_payment_request,
+            'approve_payment': self._spell_approve_payment,
+            'execute_payment': self._spell_execute_payment,
+        }
     
     def deploy(self) -> str:
         """
@@ -512,23 +660,25 @@ class BountyContractSpell:
         # 5. Return result
         
         # For now, execute locally
-        if method_name == "create_payment_request":
-            report = params.get('report')
-            address = params.get('recipient_address')
-            payment = self.contract.create_payment_request(report, address)
-            return {'success': True, 'payment_id': payment.payment_id}
-        
-        elif method_name == "approve_payment":
-            payment_id = params.get('payment_id')
-            signer = params.get('signer_address')
-            success, message = self.contract.approve_payment(payment_id, signer)
-            return {'success': success, 'message': message}
-        
-        elif method_name == "execute_payment":
-            payment_id = params.get('payment_id')
-            success, message, txid = self.contract.execute_payment(payment_id)
-            return {'success': success, 'message': message, 'txid': txid}
-        
-        else:
+        handler = self._dispatch.get(method_name)
+        if handler is None:
             return {'success': False, 'error': f"Unknown method: {method_name}"}
+        return handler(params)
+
+    def _spell_create_payment_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        report = params.get('report')
+        address = params.get('recipient_address')
+        payment = self.contract.create_payment_request(report, address)
+        return {'success': True, 'payment_id': payment.payment_id}
+
+    def _spell_approve_payment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        payment_id = params.get('payment_id')
+        signer = params.get('signer_address')
+        success, message = self.contract.approve_payment(payment_id, signer)
+        return {'success': success, 'message': message}
+
+    def _spell_execute_payment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        payment_id = params.get('payment_id')
+        success, message, txid = self.contract.execute_payment(payment_id)
+        return {'success': success, 'message': message, 'txid': txid}
 
@@ -2,9 +2,15 @@
 Charms-based validation logic for mining pool reports
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from models import MiningPoolReport, EvidenceType, ReportStatus
 from bitcoin_rpc import BitcoinRPC
+from validation_fast import is_valid_address
+
+# Shared pool for the RPC-bound validation checks; sized for the two
+# concurrent checks per report times a few in-flight validations
+_VALIDATION_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='validation')
 
 
 class ReportValidator:
@@ -41,26 +47,39 @@ class ReportValidator:
             if not validation_result[0]:
                 return validation_result
             
-            # Blockchain verification
-            validation_result = self._blockchain_verification(report)
-            if not validation_result[0]:
-                return validation_result
-            
-            # Charms spell-based validation (if enabled and spell available)
-            if use_spells:
-                try:
-                    charms_validator = CharmsValidator(self.bitcoin_rpc)
-                    spell_result = charms_validator.validate_with_spell(report)
-                    if spell_result[0] is not None:
-                        # Spell validation result (True/False) takes precedence
-                        # Merge validation data
+            # Blockchain verification and spell validation are both
+            # RPC-bound and only read chain state, so when the block hash
+            # is already known they run concurrently — latency becomes
+            # max(check latencies) instead of their sum. Without a block
+            # hash they stay sequential, because blockchain verification
+            # fills report.block_hash and the spell reads it.
+            if use_spells and report.block_hash:
+                chain_future = _VALIDATION_EXECUTOR.submit(self._blockchain_verification, report)
+                spell_future = _VALIDATION_EXECUTOR.submit(self._spell_validation, report)
+                validation_result = chain_future.result()
+                spell_result = spell_future.result()
+                if not validation_result[0]:
+                    return validation_result
+                if spell_result is not None and spell_result[0] is not None:
+                    # Spell validation result (True/False) takes precedence
+                    # Merge validation data
+                    validation_data = validation_result[2] or {}
+                    if spell_result[2]:
+                        validation_data['spell_validation'] = spell_result[2]
+                    return (spell_result[0], spell_result[1], validation_data)
+            else:
+                validation_result = self._blockchain_verification(report)
+                if not validation_result[0]:
+                    return validation_result
+                
+                # Charms spell-based validation (if enabled and spell available)
+                if use_spells:
+                    spell_result = self._spell_validation(report)
+                    if spell_result is not None and spell_result[0] is not None:
                         validation_data = validation_result[2] or {}
                         if spell_result[2]:
                             validation_data['spell_validation'] = spell_result[2]
                         return (spell_result[0], spell_result[1], validation_data)
-                except Exception as e:
-                    # If spell validation fails, continue with standard validation
-                    pass
             
             # All validations passed
             return (True, "Report validated successfully", validation_result[2])
@@ -68,6 +87,15 @@ class ReportValidator:
         except Exception as e:
             return (False, f"Validation error: {str(e)}", None)
     
+    def _spell_validation(self, report: MiningPoolReport) -> Optional[Tuple[bool, str, Optional[Dict]]]:
+        """Run spell-based validation, returning None if it errors out"""
+        try:
+            charms_validator = CharmsValidator(self.bitcoin_rpc)
+            return charms_validator.validate_with_spell(report)
+        except Exception:
+            # If spell validation fails, continue with standard validation
+            return None
+
     def _basic_validation(self, report: MiningPoolReport) -> Tuple[bool, str, Optional[Dict]]:
         """Perform basic validation checks"""
         
@@ -81,15 +109,9 @@ class ReportValidator:
         if report.block_height <= 0:
             return (False, "Valid block height is required", None)
         
-        # Validate Bitcoin addresses
-        try:
-            reporter_valid = self.bitcoin_rpc.validate_address(report.reporter_address)
-            if not reporter_valid.get('isvalid', False):
-                return (False, "Invalid reporter address", None)
-        except Exception:
-            # If RPC validation fails, do basic format check
-            if len(report.reporter_address) < 26 or len(report.reporter_address) > 62:
-                return (False, "Reporter address format appears invalid", None)
+        # Validate Bitcoin addresses locally (checksum-verified, no RPC round trip)
+        if not is_valid_address(report.reporter_address):
+            return (False, "Invalid reporter address", None)
         
         # Check if block height is reasonable (not too far in future)
         try:
@@ -175,18 +197,31 @@ class ReportValidator:
             # Verify transactions exist
             if report.transaction_ids:
                 verified_txs = []
-                for txid in report.transaction_ids:
+
+                # Fetch the block's txid set once (verbosity=1) instead of
+                # pulling the full block per transaction
+                block_txids = set()
+                if report.block_hash:
                     try:
-                        tx_info = self.bitcoin_rpc.get_transaction(txid)
-                        if tx_info:
-                            verified_txs.append(txid)
-                            # Check if transaction is in the reported block
-                            if report.block_hash:
-                                in_block = self.bitcoin_rpc.verify_transaction_in_block(txid, report.block_hash)
-                                verification_data[f'tx_{txid}_in_block'] = in_block
+                        block_txids = set(self.bitcoin_rpc.get_block_txids(report.block_hash))
                     except Exception:
+                        block_txids = set()
+
+                # Batch all evidence-transaction lookups into one round trip
+                tx_infos = self.bitcoin_rpc._call_batch([
+                    ('getrawtransaction', [txid, True])
+                    for txid in report.transaction_ids
+                ])
+
+                for txid, tx_info in zip(report.transaction_ids, tx_infos):
+                    if tx_info:
+                        verified_txs.append(txid)
+                        # Check if transaction is in the reported block
+                        if report.block_hash:
+                            verification_data[f'tx_{txid}_in_block'] = txid in block_txids
+                    else:
                         verification_data[f'tx_{txid}_verified'] = False
-                
+
                 verification_data['verified_transactions'] = verified_txs
                 if len(verified_txs) == 0:
                     return (False, "None of the provided transaction IDs could be verified", None)
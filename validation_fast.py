@@ -0,0 +1,116 @@
+"""
+Fast local Bitcoin address validation
+
+Validates base58check and bech32/bech32m addresses entirely in-process
+(compiled regex prefilter + checksum verification) so report validation
+does not need a `validateaddress` RPC round trip per address.
+"""
+
+import re
+from hashlib import sha256
+
+
+# Structural prefilters - reject obviously malformed input before decoding
+_BASE58_RE = re.compile(r'^[123mn][1-9A-HJ-NP-Za-km-z]{25,34}$')
+_BECH32_RE = re.compile(r'^(bc|tb|bcrt)1[02-9ac-hj-np-z]{6,87}$', re.IGNORECASE)
+
+_BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_BASE58_INDEX = {c: i for i, c in enumerate(_BASE58_ALPHABET)}
+
+_BECH32_CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
+_BECH32_INDEX = {c: i for i, c in enumerate(_BECH32_CHARSET)}
+
+# Valid checksum constants: 1 for bech32 (segwit v0), 0x2bc830a3 for bech32m (v1+)
+_BECH32_CONSTANTS = (1, 0x2bc830a3)
+
+
+def base58check_verify(address: str) -> bool:
+    """
+    Verify a base58check address (decode + double-SHA256 checksum)
+
+    Args:
+        address: Base58-encoded address string
+
+    Returns:
+        True if the checksum is valid
+    """
+    value = 0
+    try:
+        for char in address:
+            value = value * 58 + _BASE58_INDEX[char]
+    except KeyError:
+        return False
+
+    try:
+        decoded = value.to_bytes(25, 'big')
+    except OverflowError:
+        return False
+
+    checksum = sha256(sha256(decoded[:21]).digest()).digest()[:4]
+    return checksum == decoded[21:]
+
+
+def _bech32_polymod(values) -> int:
+    """BIP-173 checksum polymod"""
+    generator = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            chk ^= generator[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+def bech32_verify(address: str) -> bool:
+    """
+    Verify a bech32/bech32m address checksum (BIP-173/BIP-350)
+
+    Args:
+        address: Bech32-encoded address string
+
+    Returns:
+        True if the checksum is valid
+    """
+    # Mixed case is invalid per BIP-173
+    if address != address.lower() and address != address.upper():
+        return False
+
+    address = address.lower()
+    pos = address.rfind('1')
+    if pos < 1 or pos + 7 > len(address):
+        return False
+
+    hrp = address[:pos]
+    try:
+        data = [_BECH32_INDEX[c] for c in address[pos + 1:]]
+    except KeyError:
+        return False
+
+    hrp_expanded = [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+    return _bech32_polymod(hrp_expanded + data) in _BECH32_CONSTANTS
+
+
+def is_valid_address(address: str) -> bool:
+    """
+    Check whether a string is a structurally valid Bitcoin address
+
+    Accepts legacy/P2SH base58check and segwit bech32/bech32m addresses
+    (mainnet, testnet, and regtest prefixes).
+
+    Args:
+        address: Address string to check
+
+    Returns:
+        True if the address passes format and checksum validation
+    """
+    if not address:
+        return False
+
+    if _BECH32_RE.match(address):
+        return bech32_verify(address)
+
+    if _BASE58_RE.match(address):
+        return base58check_verify(address)
+
+    return False